@@ -0,0 +1,13 @@
+from typing import Generator
+
+import pytest
+
+from benchmarks.static_site import StaticSite
+
+
+@pytest.fixture(scope="session")
+def static_site() -> Generator[StaticSite, None, None]:
+    site = StaticSite()
+    site.start()
+    yield site
+    site.stop()
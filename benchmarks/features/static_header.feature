@@ -0,0 +1,25 @@
+Feature: Framework overhead on a static header page
+  As a framework maintainer
+  I want to run header-style scenarios against a local static page
+  So that I can measure the framework's own overhead without the live site or a model
+
+  @benchmark
+  Scenario: Header elements are visible on the static page
+    Given I open the static header page
+    When I look at the static header
+    Then every header menu item should be visible
+    And every social link should be visible
+    And the phone link should point to a tel: URL
+
+  @benchmark
+  Scenario: Hovering a menu item opens its dropdown
+    Given I open the static header page
+    When I hover over the "SERVICES" static menu item
+    Then the "SERVICES" dropdown should list "Life Insurance"
+
+  @benchmark
+  Scenario: Clicking a menu item navigates to its page
+    Given I open the static header page
+    When I click the "ABOUT US" static menu item
+    Then the URL should end with "/about-us/"
+    And the page heading should be "About Us"
@@ -0,0 +1,158 @@
+"""
+Runs the static-page benchmark scenarios for every device and worker count, stores the
+results and compares them against a saved baseline.
+
+Each configuration is a separate pytest run with ``--timing-report``; the p50 of every
+fixture, browser startup, ``BaseActions`` method, step and scenario becomes a metric.
+
+Usage:
+    python -m benchmarks.run_benchmarks                     # all devices, 1 and 2 workers
+    python -m benchmarks.run_benchmarks --devices desktop --workers 1
+    python -m benchmarks.run_benchmarks --save-baseline     # store this run as baseline
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from utils.timing import ACTION, BROWSER_STARTUP, FIXTURE, STEP, TEST
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+DEVICES = ["mobile", "ipad", "desktop"]
+WORKER_COUNTS = [1, 2]
+METRIC_CATEGORIES = [FIXTURE, BROWSER_STARTUP, ACTION, STEP, TEST]
+
+# A metric regresses when it is this much slower than the baseline...
+REGRESSION_TOLERANCE = 0.2
+# ...and the slowdown is larger than timer noise
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def run_configuration(device: str, workers: int) -> Dict[str, float]:
+    """
+    Run the benchmark scenarios once and collect their timing metrics.
+
+    Args:
+        device: Device passed to --device
+        workers: pytest-xdist worker count; 1 runs without xdist
+
+    Returns:
+        Metric name ("<category>:<name>" or "wall") mapped to seconds
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        report_dir = os.path.join(work_dir, "timing")
+        command = [
+            sys.executable,
+            "-m",
+            "pytest",
+            BENCHMARK_DIR,
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            f"--device={device}",
+            "--headless",
+            "--stagehand-model=mock",
+            f"--mock-llm-dir={os.path.join(work_dir, 'mock_llm')}",
+            f"--act-cache-dir={os.path.join(work_dir, 'cache')}",
+            f"--timing-report={report_dir}",
+        ]
+        if workers > 1:
+            command += ["-n", str(workers)]
+
+        start = time.perf_counter()
+        completed = subprocess.run(command, cwd=REPO_ROOT)
+        wall_seconds = time.perf_counter() - start
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"Benchmark run failed for {device} with {workers} worker(s) "
+                f"(exit code {completed.returncode})"
+            )
+
+        with open(
+            os.path.join(report_dir, "timing_report.json"), encoding="utf-8"
+        ) as report_file:
+            report = json.load(report_file)
+
+    metrics = {"wall": wall_seconds}
+    for entry in report["entries"]:
+        if entry["category"] in METRIC_CATEGORIES:
+            metrics[f"{entry['category']}:{entry['name']}"] = entry["p50"]
+    return metrics
+
+
+def find_regressions(results: dict, baseline: dict) -> List[str]:
+    regressions = []
+    for configuration, metrics in results.items():
+        for metric, baseline_seconds in baseline.get(configuration, {}).items():
+            current_seconds = metrics.get(metric)
+            if current_seconds is None:
+                continue
+            slowdown = current_seconds - baseline_seconds
+            if (
+                current_seconds > baseline_seconds * (1 + REGRESSION_TOLERANCE)
+                and slowdown > MIN_REGRESSION_SECONDS
+            ):
+                regressions.append(
+                    f"{configuration} {metric}: {baseline_seconds:.3f}s -> "
+                    f"{current_seconds:.3f}s (+{slowdown / baseline_seconds:.0%})"
+                )
+    return regressions
+
+
+def save_json(path: str, data: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=2, sort_keys=True)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--devices", nargs="+", choices=DEVICES, default=DEVICES)
+    parser.add_argument("--workers", nargs="+", type=int, default=WORKER_COUNTS)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing against it",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = {
+        f"{device}/{workers}w": run_configuration(device, workers)
+        for device in args.devices
+        for workers in args.workers
+    }
+    save_json(
+        os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json"), results
+    )
+
+    if args.save_baseline:
+        save_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        regressions = find_regressions(results, json.load(baseline_file))
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
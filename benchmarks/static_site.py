@@ -0,0 +1,45 @@
+"""
+Localhost HTTP server for the static header page in ``benchmarks/site``.
+"""
+
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site")
+
+
+class QuietRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticSite:
+    """
+    Serves ``site_dir`` on a free localhost port from a background thread.
+
+    Args:
+        site_dir: Directory whose files are served as-is
+    """
+
+    def __init__(self, site_dir: str = SITE_DIR):
+        self.site_dir = site_dir
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        handler = functools.partial(QuietRequestHandler, directory=self.site_dir)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,114 @@
+from pytest_bdd import given, parsers, scenarios, then, when
+from stagehand import Stagehand
+
+from benchmarks.static_site import StaticSite
+from tests.pages.base.base_action import BaseActions
+from tests.pages.base.readiness import ReadinessPolicy
+
+scenarios("features/static_header.feature")
+
+MENU_ITEMS = ["SERVICES", "EVENTS", "MEDIA", "NEWS", "ABOUT US", "CONTACT US"]
+SOCIAL_LINK_LOCATORS = [
+    'a[href*="facebook.com"]',
+    'a[href*="x.com"]',
+    'a[href*="linkedin.com"]',
+    'a[href*="youtube.com"]',
+    'a[href*="instagram.com"]',
+]
+PHONE_LINK_LOCATOR = 'a[href^="tel:"]'
+SUB_MENU_LOCATOR = ".sub-menu"
+SETTLE_TIMEOUT = 5
+
+
+def menu_item_locator(menu_item: str) -> str:
+    return f'.main-menu > .menu-item > a:text-is("{menu_item}")'
+
+
+@given("I open the static header page")
+async def open_static_header_page(
+    stagehand_on_demand: Stagehand,
+    static_site: StaticSite,
+    readiness_policy: ReadinessPolicy,
+):
+    base_actions = BaseActions(stagehand_on_demand.page)
+    await base_actions.open_url(f"{static_site.base_url}/")
+    await base_actions.wait_until_ready(readiness_policy)
+
+
+@when("I look at the static header")
+async def look_at_static_header(stagehand_on_demand: Stagehand):
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_for_animations_finished()
+
+
+@when(parsers.parse('I hover over the "{menu_item}" static menu item'))
+async def hover_static_menu_item(stagehand_on_demand: Stagehand, menu_item: str):
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    await base_actions.hover_element(menu_item_locator(menu_item))
+    await base_actions.wait_for_dropdown_visible(SUB_MENU_LOCATOR)
+
+
+@when(parsers.parse('I click the "{menu_item}" static menu item'))
+async def click_static_menu_item(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy, menu_item: str
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    base_actions = BaseActions(page)
+    await base_actions.click_element(menu_item_locator(menu_item))
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
+
+
+@then("every header menu item should be visible")
+async def every_menu_item_visible(stagehand_on_demand: Stagehand):
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    results = await base_actions.verify_all_visible(
+        [menu_item_locator(menu_item) for menu_item in MENU_ITEMS]
+    )
+    missing_items = [
+        menu_item
+        for menu_item in MENU_ITEMS
+        if not results[menu_item_locator(menu_item)]
+    ]
+    assert not missing_items, f"Menu items not visible: {missing_items}"
+
+
+@then("every social link should be visible")
+async def every_social_link_visible(stagehand_on_demand: Stagehand):
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    results = await base_actions.verify_all_visible(SOCIAL_LINK_LOCATORS)
+    missing_links = [
+        locator for locator, is_visible in results.items() if not is_visible
+    ]
+    assert not missing_links, f"Social links not visible: {missing_links}"
+
+
+@then("the phone link should point to a tel: URL")
+async def phone_link_points_to_tel(stagehand_on_demand: Stagehand):
+    page = stagehand_on_demand.page
+    href = await page.locator(PHONE_LINK_LOCATOR).first.get_attribute("href")
+    assert href and href.startswith("tel:")
+
+
+@then(parsers.parse('the "{menu_item}" dropdown should list "{item}"'))
+async def dropdown_lists_item(
+    stagehand_on_demand: Stagehand, menu_item: str, item: str
+):
+    page = stagehand_on_demand.page
+    base_actions = BaseActions(page, default_timeout=SETTLE_TIMEOUT)
+    item_locator = page.locator(
+        f'.menu-item:has(> a:text-is("{menu_item}")) > .sub-menu a:text-is("{item}")'
+    )
+    assert await base_actions.verify_element_visible(item_locator)
+
+
+@then(parsers.parse('the URL should end with "{suffix}"'))
+async def url_ends_with(stagehand_on_demand: Stagehand, suffix: str):
+    assert stagehand_on_demand.page.url.endswith(suffix)
+
+
+@then(parsers.parse('the page heading should be "{heading}"'))
+async def page_heading_is(stagehand_on_demand: Stagehand, heading: str):
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    assert await base_actions.verify_element_text("h1", heading)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Optional
 
+DEVICE_TYPES = ["mobile", "ipad", "desktop"]
+
 
 @dataclass
 class Device:
@@ -9,6 +11,12 @@ class Device:
     width: int
     height: int
     user_agent: Optional[str] = None
+    device_scale_factor: float = 1
+    is_mobile: bool = False
+    has_touch: bool = False
+    locale: str = "en-US"
+    # Request blocking preset from utils.network_profiles; --network-profile overrides it
+    network_profile: str = "full"
 
     def __post_init__(self):
         if self.user_agent is None:
@@ -16,6 +24,22 @@ class Device:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             )
 
+    def context_options(self) -> dict:
+        """
+        Keyword arguments for ``Browser.new_context`` that emulate this device.
+
+        Returns:
+            Viewport, user agent, pixel ratio, mobile/touch flags and locale
+        """
+        return {
+            "viewport": {"width": self.width, "height": self.height},
+            "user_agent": self.user_agent,
+            "device_scale_factor": self.device_scale_factor,
+            "is_mobile": self.is_mobile,
+            "has_touch": self.has_touch,
+            "locale": self.locale,
+        }
+
 
 class Mobile(Device):
     """(iPhone 15 Pro Max size)"""
@@ -29,6 +53,9 @@ class Mobile(Device):
                 "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) "
                 "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
             ),
+            device_scale_factor=3,
+            is_mobile=True,
+            has_touch=True,
         )
 
 
@@ -44,6 +71,9 @@ class Ipad(Device):
                 "Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) "
                 "AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
             ),
+            device_scale_factor=2,
+            is_mobile=True,
+            has_touch=True,
         )
 
 
@@ -76,7 +106,7 @@ def get_device_class(device_type: str) -> Device:
     if device_class is None:
         raise ValueError(
             f"Unsupported device type: {device_type}. "
-            f"Supported types: {', '.join(['mobile', 'ipad', 'desktop'])}"
+            f"Supported types: {', '.join(DEVICE_TYPES)}"
         )
 
     return device_class()
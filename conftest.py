@@ -1,18 +1,70 @@
-import asyncio
+import argparse
 import os
-import random
 import shutil
 import subprocess
-import tempfile
 import time
 import warnings
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Generator, List, Optional
 
 import pytest
 from dotenv import load_dotenv
 from stagehand import Stagehand, StagehandConfig
 
-from config.devices import get_device_class
+from config.devices import DEVICE_TYPES, Device, get_device_class
+from tests.pages.base.deferred_actions import (
+    DEFERRED_ACTIONS_KEY,
+    NEXT_STEP_KEY,
+    find_next_step_name,
+)
+from tests.pages.base.page_snapshot import PageSnapshot
+from tests.pages.base.readiness import (
+    DEFAULT_READINESS,
+    READINESS_POLICIES,
+    ReadinessPolicy,
+    get_readiness_policy,
+)
+from tests.pages.base.step_retry import (
+    DEFAULT_SCENARIO_RETRY_BUDGET,
+    DEFAULT_STEP_RETRY_DELAY,
+    STEP_RETRY_BUDGET,
+)
+from utils.act_cache import ActCache
+from utils.artifacts import (
+    ARTIFACT_MODES,
+    DEFAULT_ARTIFACT_RUNS_KEPT,
+    DEFAULT_ARTIFACT_STEPS,
+    DEFAULT_ARTIFACTS_MAX_MB,
+    FAILURE_ARTIFACTS,
+    NO_ARTIFACTS,
+    TRACE_ARTIFACTS,
+    ArtifactBudget,
+    ScenarioArtifacts,
+    new_run_dir,
+    prune_run_dirs,
+)
+from utils.browser_pool import DEFAULT_BROWSER_MAX_RSS_MB, BrowserPool
+from utils.duration_scheduler import DurationPlugin, DurationStore
+from utils.har_store import RECORD_MODE, REPLAY_MODE, HarStore
+from utils.impact import ImpactIndex, ImpactRecorder, changed_lines, select
+from utils.locator_manifest import LOCATOR_MODES, OFF_MODE, LocatorManifest
+from utils.log_pipeline import LogPipeline, parse_logger_levels, stagehand_log_handler
+from utils.mock_llm import MOCK_MODEL, MockLLMServer
+from utils.network_profiles import NETWORK_PROFILES, get_network_profile
+from utils.resource_allocator import get_worker_id, reap_browsers
+from utils.timing import (
+    FIXTURE,
+    RAW_DIR_NAME,
+    STEP,
+    TEARDOWN,
+    TEST,
+    TIMINGS,
+    build_report,
+    format_summary,
+    raw_dump_path,
+)
+
+# Async step definitions are awaited on the session loop (pytest-bdd never awaits them)
+pytest_plugins = ["tests.pages.base.async_steps", "pytester"]
 
 # Load environment variables from .env file
 load_dotenv()
@@ -23,6 +75,59 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 warnings.filterwarnings("ignore", message=".*coroutine.*was never awaited.*")
 warnings.filterwarnings("ignore", message=".*coroutine.*")
 
+# Chromium switches applied to every pooled browser process
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-domain-reliability",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-blink-features=AutomationControlled",
+]
+
+
+# Queue-based file logging of this process
+LOG_PIPELINE_KEY = pytest.StashKey[LogPipeline]()
+
+# --device value that runs every scenario on each of DEVICE_TYPES
+ALL_DEVICES = "all"
+
+# Peak browser memory and recycle count of this process's pool
+BROWSER_MEMORY_KEY = pytest.StashKey[dict]()
+# Browser memory of every xdist worker, collected by the controller
+WORKER_MEMORY_KEY = pytest.StashKey[Dict[str, dict]]()
+
+# Start time of the pytest-bdd step call currently running in this test; its fixtures
+# are resolved (and timed as fixtures) before it is set
+STEP_START_KEY = pytest.StashKey[float]()
+
+# Reports of the test's setup/call phases, read back by fixture teardown
+PHASE_REPORTS_KEY = pytest.StashKey[Dict[str, pytest.TestReport]]()
+
+# Directory the failure artifacts of this run are flushed to
+ARTIFACTS_RUN_DIR_KEY = pytest.StashKey[str]()
+
+# Failure artifacts of the scenario running in this test
+SCENARIO_ARTIFACTS_KEY = pytest.StashKey[ScenarioArtifacts]()
+
 
 def pytest_configure(config):
     """Configure pytest to filter warnings."""
@@ -32,14 +137,127 @@ def pytest_configure(config):
         "filterwarnings", "ignore:coroutine.*was never awaited:RuntimeWarning"
     )
 
+    if config.getoption("--record-har") and config.getoption("--replay-har"):
+        raise pytest.UsageError("--record-har and --replay-har are mutually exclusive")
+
+    try:
+        logger_levels = parse_logger_levels(config.getoption("--logger-levels"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    log_pipeline = LogPipeline(
+        config.getoption("--log-dir"),
+        get_worker_id(),
+        logger_levels,
+        compress=config.getoption("--log-compress"),
+    )
+    log_pipeline.start()
+    config.stash[LOG_PIPELINE_KEY] = log_pipeline
+
+    # Drop raw timing dumps of a previous run before any worker writes new ones
+    report_dir = config.getoption("--timing-report")
+    if report_dir and not hasattr(config, "workerinput"):
+        shutil.rmtree(os.path.join(report_dir, RAW_DIR_NAME), ignore_errors=True)
+
+    # Each run flushes into its own directory, shared with its xdist workers
+    if hasattr(config, "workerinput"):
+        config.stash[ARTIFACTS_RUN_DIR_KEY] = config.workerinput["artifacts_run_dir"]
+    else:
+        config.stash[ARTIFACTS_RUN_DIR_KEY] = new_run_dir(_artifacts_root(config))
+
+    if config.getoption("--record-impact"):
+        config.pluginmanager.register(
+            ImpactRecorder(
+                ImpactIndex(_impact_index_path(config)),
+                str(config.rootpath),
+                get_worker_id(),
+                merge=not hasattr(config, "workerinput"),
+            ),
+            "impact_recorder",
+        )
+
+    # Workers report every test back to the controller, which records and schedules them
+    if not hasattr(config, "workerinput"):
+        durations_path = config.getoption("--durations-file") or os.path.join(
+            config.getoption("--act-cache-dir"), "test_durations.json"
+        )
+        config.pluginmanager.register(
+            DurationPlugin(
+                DurationStore(durations_path),
+                schedule=not config.getoption("--no-duration-scheduling"),
+            ),
+            "duration_plugin",
+        )
+
+
+def pytest_report_header(config):
+    profile_name = config.getoption("--network-profile")
+    if profile_name and get_network_profile(profile_name).blocks_anything:
+        return (
+            f"network profile: {profile_name} (filtered requests never reach the site)"
+        )
+
+
+def pytest_unconfigure(config):
+    log_pipeline = config.stash.get(LOG_PIPELINE_KEY, None)
+    if log_pipeline is not None:
+        log_pipeline.stop()
+
+
+def _artifacts_root(config) -> str:
+    return os.path.join(str(config.rootpath), config.getoption("--artifacts-dir"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["artifacts_run_dir"] = node.config.stash[ARTIFACTS_RUN_DIR_KEY]
+
+
+def _impact_index_path(config) -> str:
+    return config.getoption("--impact-index") or os.path.join(
+        config.getoption("--act-cache-dir"), "impact_index.json"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    since = config.getoption("--impact-since")
+    if not since:
+        return
+    index = ImpactIndex(_impact_index_path(config))
+    if not index.load():
+        print(f"⚠️ No impact index at {index.path}; running every selected scenario")
+        return
+    try:
+        changes = changed_lines(since, str(config.rootpath))
+    except (subprocess.CalledProcessError, OSError) as e:
+        raise pytest.UsageError(f"Cannot diff against {since}: {e}")
+    selected = select(items, index, changes, str(config.rootpath))
+    deselected = [item for item in items if item not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def parse_devices(value: str) -> List[str]:
+    if value.strip().lower() == ALL_DEVICES:
+        return list(DEVICE_TYPES)
+    devices = [name.strip().lower() for name in value.split(",") if name.strip()]
+    unknown = [name for name in devices if name not in DEVICE_TYPES]
+    if unknown or not devices:
+        raise argparse.ArgumentTypeError(
+            f"unsupported device(s) {', '.join(unknown) or repr(value)}; "
+            f"choose from {', '.join(DEVICE_TYPES)} or '{ALL_DEVICES}'"
+        )
+    return list(dict.fromkeys(devices))
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--device",
         action="store",
         default="desktop",
-        choices=["mobile", "ipad", "desktop"],
-        help="Device type to use for tests (mobile, ipad, desktop)",
+        type=parse_devices,
+        help="Device type to use for tests (mobile, ipad, desktop), a comma-separated "
+        "list or 'all'; several devices run every scenario once per device",
     )
     parser.addoption(
         "--headless",
@@ -51,121 +269,504 @@ def pytest_addoption(parser):
         "--stagehand-model",
         action="store",
         default="gpt-5-nano",
-        help="Stagehand model name to use",
+        help="Stagehand model name to use ('mock' serves recorded answers locally)",
+    )
+    parser.addoption(
+        "--mock-llm-dir",
+        action="store",
+        default="mock_llm_recordings",
+        help="Recorded model answers served by --stagehand-model=mock",
+    )
+    parser.addoption(
+        "--mock-llm-upstream",
+        action="store",
+        default=None,
+        help="OpenAI model that answers and records prompts the mock model has not seen",
+    )
+    parser.addoption(
+        "--browser-pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Number of warm browsers kept per worker and reused across tests",
+    )
+    parser.addoption(
+        "--browser-max-rss-mb",
+        action="store",
+        type=int,
+        default=DEFAULT_BROWSER_MAX_RSS_MB,
+        help="Relaunch a pooled browser whose memory (with its renderers) exceeds "
+        "this many MB after a test; 0 disables the ceiling",
+    )
+    parser.addoption(
+        "--browser-max-tests",
+        action="store",
+        type=int,
+        default=0,
+        help="Relaunch a pooled browser after this many tests; 0 never relaunches",
+    )
+    parser.addoption(
+        "--act-cache-dir",
+        action="store",
+        default=".stagehand_cache",
+        help="Directory of the persistent cache for resolved page.act() instructions",
+    )
+    parser.addoption(
+        "--no-act-cache",
+        action="store_true",
+        default=False,
+        help="Always resolve page.act() instructions with the model",
+    )
+    parser.addoption(
+        "--locator-mode",
+        action="store",
+        default=OFF_MODE,
+        choices=LOCATOR_MODES,
+        help="compile: record static locators for act() steps; fast: replay them",
+    )
+    parser.addoption(
+        "--locator-manifest",
+        action="store",
+        default=None,
+        help="Locator manifest file (default: <act-cache-dir>/locator_manifest.json)",
+    )
+    parser.addoption(
+        "--readiness",
+        action="store",
+        default=DEFAULT_READINESS,
+        choices=list(READINESS_POLICIES),
+        help="Condition steps wait for after a navigation "
+        "(network-quiet: network idle ignoring ads/analytics)",
+    )
+    parser.addoption(
+        "--network-profile",
+        action="store",
+        default=None,
+        choices=list(NETWORK_PROFILES),
+        help="Request blocking profile; lean and assertions-only skip parts of the site "
+        "(default: the device's own profile, full)",
+    )
+    parser.addoption(
+        "--timing-report",
+        action="store",
+        default=None,
+        help="Directory for the step/fixture/model timing report (JSON and CSV)",
+    )
+    parser.addoption(
+        "--record-har",
+        action="store_true",
+        default=False,
+        help="Record each scenario's network traffic into the HAR store",
+    )
+    parser.addoption(
+        "--replay-har",
+        action="store_true",
+        default=False,
+        help="Serve each scenario's network traffic from the HAR store, offline",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default="har_store",
+        help="Directory of the versioned per-scenario HAR recordings",
+    )
+    parser.addoption(
+        "--step-retries",
+        action="store",
+        type=int,
+        default=DEFAULT_SCENARIO_RETRY_BUDGET,
+        help="Retries of @retryable_step steps allowed per scenario before it fails "
+        "(and --reruns reruns the whole scenario); 0 disables step retries",
+    )
+    parser.addoption(
+        "--step-retry-delay",
+        action="store",
+        type=float,
+        default=DEFAULT_STEP_RETRY_DELAY,
+        help="Seconds before the first in-place step retry, doubled for each further one",
+    )
+    parser.addoption(
+        "--artifacts",
+        action="store",
+        default=FAILURE_ARTIFACTS,
+        choices=ARTIFACT_MODES,
+        help="Artifacts saved when a scenario fails: screenshot, DOM and step log "
+        "('failure'), plus a Playwright trace recorded for every scenario ('trace'), "
+        "or nothing ('off')",
+    )
+    parser.addoption(
+        "--artifacts-dir",
+        action="store",
+        default="artifacts",
+        help="Directory of the failure artifacts, relative to the rootdir; each run "
+        "writes to its own run-<timestamp>-<pid> subdirectory and the "
+        f"{DEFAULT_ARTIFACT_RUNS_KEPT} newest are kept",
+    )
+    parser.addoption(
+        "--artifacts-max-mb",
+        action="store",
+        type=int,
+        default=DEFAULT_ARTIFACTS_MAX_MB,
+        help="Size cap of all failure artifacts of a run, in MB",
+    )
+    parser.addoption(
+        "--artifact-steps",
+        action="store",
+        type=int,
+        default=DEFAULT_ARTIFACT_STEPS,
+        help="Number of most recent steps kept in a failed scenario's step log",
+    )
+    parser.addoption(
+        "--log-dir",
+        action="store",
+        default="logs",
+        help="Directory of the per-worker, size-rotated log files",
+    )
+    parser.addoption(
+        "--logger-levels",
+        action="store",
+        default=None,
+        help="Per-logger levels such as 'stagehand=DEBUG,playwright=INFO' "
+        "(defaults: stagehand INFO, playwright WARNING, tests DEBUG)",
+    )
+    parser.addoption(
+        "--log-compress",
+        action="store_true",
+        default=False,
+        help="Gzip rotated log files",
+    )
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Record the step functions and BaseActions methods each scenario uses",
+    )
+    parser.addoption(
+        "--impact-since",
+        action="store",
+        default=None,
+        help="Only run scenarios affected by changes since this git revision",
+    )
+    parser.addoption(
+        "--impact-index",
+        action="store",
+        default=None,
+        help="Scenario dependency index (default: <act-cache-dir>/impact_index.json)",
+    )
+    parser.addoption(
+        "--durations-file",
+        action="store",
+        default=None,
+        help="Per-scenario durations used to schedule -n runs "
+        "(default: <act-cache-dir>/test_durations.json)",
+    )
+    parser.addoption(
+        "--no-duration-scheduling",
+        action="store_true",
+        default=False,
+        help="Use pytest-xdist's default load distribution instead of longest-first",
     )
 
 
-@pytest.fixture(scope="function")
-async def stagehand_on_demand(request) -> AsyncGenerator[Stagehand, None]:
-    device_type = request.config.getoption("--device", default="desktop")
-    device_instance = get_device_class(device_type)
-
-    # Generate random port to avoid conflicts
-    debug_port = 9222 + random.randint(0, 1000)
-    user_data_dir = tempfile.mkdtemp(
-        prefix=f"stagehand_test_{random.randint(1000, 9999)}_"
-    )
-
-    # Handle parallel execution with pytest-xdist
-    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
-    if worker_id != "main":
-        # Add longer delay for parallel execution
-        delay = random.uniform(0.5, 2.0)
-        print(
-            f"Worker {worker_id}: Delaying {delay:.2f} seconds to avoid resource conflicts"
-        )
-        await asyncio.sleep(delay)
+@pytest.fixture(scope="session")
+def mock_llm_server(request) -> Generator[Optional[MockLLMServer], None, None]:
+    if request.config.getoption("--stagehand-model") != MOCK_MODEL:
+        yield None
+        return
+    server = MockLLMServer(
+        request.config.getoption("--mock-llm-dir"),
+        upstream_model=request.config.getoption("--mock-llm-upstream"),
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+async def stagehand_pool(
+    request, mock_llm_server: Optional[MockLLMServer]
+) -> AsyncGenerator[BrowserPool, None]:
+    headless = request.config.getoption("--headless", default=False)
+
+    if mock_llm_server is not None:
+        model_options = mock_llm_server.stagehand_options()
     else:
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        model_options = {
+            "model_name": request.config.getoption(
+                "--stagehand-model", default="gpt-5-nano"
+            ),
+            "model_api_key": os.getenv("OPENAI_API_KEY"),
+        }
 
-    # Stagehand configuration
+    # Stagehand configuration; each pooled browser fills in its own CDP endpoint.
+    # Its log lines go through the queued log pipeline instead of the console.
     config = StagehandConfig(
         env="LOCAL",
-        model_name=request.config.getoption("--stagehand-model", default="gpt-5-nano"),
-        model_api_key=os.getenv("OPENAI_API_KEY"),
-        verbose=1,
-        local_browser_launch_options={
-            "headless": request.config.getoption("--headless", default=False),
-            "user_data_dir": user_data_dir,
-            "viewport": {
-                "width": device_instance.width,
-                "height": device_instance.height,
-            },
-            "args": [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                f"--remote-debugging-port={debug_port}",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-extensions",
-                "--disable-plugins",
-                "--disable-default-apps",
-                "--disable-sync",
-                "--disable-translate",
-                "--disable-component-extensions-with-background-pages",
-                "--memory-pressure-off",
-                "--max_old_space_size=4096",
-                "--disable-background-networking",
-                "--disable-background-timer-throttling",
-                "--disable-client-side-phishing-detection",
-                "--disable-default-apps",
-                "--disable-hang-monitor",
-                "--disable-prompt-on-repost",
-                "--disable-domain-reliability",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-                "--disable-blink-features=AutomationControlled",
-            ]
-            + (
-                ["--headless"]
-                if request.config.getoption("--headless", default=False)
-                else []
-            ),
-        },
+        verbose=request.config.stash[LOG_PIPELINE_KEY].stagehand_verbosity(),
+        logger=stagehand_log_handler,
+        **model_options,
     )
 
-    stagehand = Stagehand(config)
+    pool = BrowserPool(
+        config,
+        CHROMIUM_ARGS + (["--headless"] if headless else []),
+        size=request.config.getoption("--browser-pool-size"),
+        max_rss_mb=request.config.getoption("--browser-max-rss-mb"),
+        max_leases=request.config.getoption("--browser-max-tests"),
+    )
 
     try:
-        await stagehand.init()
-        yield stagehand
+        await pool.start()
+        yield pool
     except Exception as e:
         print(f"❌ Stagehand initialization failed: {e}")
         raise
     finally:
-        try:
-            await stagehand.close()
-        except Exception as e:
-            print(f"Error closing Stagehand: {e}")
-        finally:
-            try:
-                shutil.rmtree(user_data_dir, ignore_errors=True)
-            except OSError:
-                pass
-            await asyncio.sleep(1)
+        await pool.close()
+        request.config.stash[BROWSER_MEMORY_KEY] = pool.memory_stats()
 
 
-def pytest_sessionfinish(session, exitstatus):
-    # Only run cleanup locally, skip in CI environment
-    # CI environments are fresh each run and auto-cleanup after job completion
-    if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-        return
+@pytest.fixture(scope="session")
+def har_store(request) -> Optional[HarStore]:
+    record_har = request.config.getoption("--record-har")
+    replay_har = request.config.getoption("--replay-har")
+    if not (record_har or replay_har):
+        return None
+    return HarStore(
+        request.config.getoption("--har-dir"),
+        RECORD_MODE if record_har else REPLAY_MODE,
+    )
+
 
-    # Local cleanup - kill lingering browser processes
-    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
-    if worker_id is None:
-        try:
-            subprocess.run(["pkill", "-f", "stagehand_ctx"], check=False, timeout=5)
-            subprocess.run(
-                ["pkill", "-f", "chromium.*stagehand"], check=False, timeout=5
+def pytest_generate_tests(metafunc):
+    # Only scenarios run per device; every pytest-bdd scenario function requests the
+    # ``_pytest_bdd_example`` fixture, plain tests (e.g. tests/unit) keep the single device
+    devices = metafunc.config.getoption("--device")
+    if len(devices) > 1 and "_pytest_bdd_example" in metafunc.fixturenames:
+        metafunc.parametrize("device", devices, indirect=True)
+
+
+@pytest.fixture(autouse=True)
+def device(request) -> Device:
+    """Device the test runs on: its matrix parameter, or the single --device."""
+    if hasattr(request, "param"):
+        return get_device_class(request.param)
+    return get_device_class(request.config.getoption("--device")[0])
+
+
+@pytest.fixture(scope="function")
+async def stagehand_on_demand(
+    request,
+    stagehand_pool: BrowserPool,
+    har_store: Optional[HarStore],
+    device: Device,
+) -> AsyncGenerator[Stagehand, None]:
+    # Every device is emulated by its own context on the worker's shared browser
+    context_options = device.context_options()
+    network_profile = get_network_profile(
+        request.config.getoption("--network-profile") or device.network_profile
+    )
+    # A HAR is written per scenario when its context closes, so HAR runs never share pages
+    shared = (
+        har_store is None and request.node.get_closest_marker("shared_page") is not None
+    )
+    async with stagehand_pool.lease(
+        context_options, network_profile, shared=shared
+    ) as stagehand:
+        if har_store is not None:
+            await har_store.attach(stagehand.context, request.node.nodeid, device.name)
+        artifacts = await _start_artifacts(request, stagehand)
+        yield stagehand
+        if artifacts is not None:
+            reports = request.node.stash.get(PHASE_REPORTS_KEY, {})
+            await artifacts.finish(
+                failed=any(report.failed for report in reports.values())
             )
-            subprocess.run(
-                ["pkill", "-f", "chrome.*stagehand"], check=False, timeout=5
+
+
+async def _start_artifacts(
+    request, stagehand: Stagehand
+) -> Optional[ScenarioArtifacts]:
+    mode = request.config.getoption("--artifacts")
+    if mode == NO_ARTIFACTS:
+        return None
+    artifacts = ScenarioArtifacts(
+        stagehand.context,
+        stagehand.page,
+        request.node.nodeid,
+        ArtifactBudget(
+            request.config.stash[ARTIFACTS_RUN_DIR_KEY],
+            request.config.getoption("--artifacts-max-mb") * 1024 * 1024,
+        ),
+        trace=mode == TRACE_ARTIFACTS,
+        history_size=request.config.getoption("--artifact-steps"),
+    )
+    await artifacts.start()
+    request.node.stash[SCENARIO_ARTIFACTS_KEY] = artifacts
+    return artifacts
+
+
+@pytest.fixture(scope="function")
+def page_snapshot(
+    stagehand_on_demand: Stagehand,
+) -> Generator[PageSnapshot, None, None]:
+    snapshot = PageSnapshot(stagehand_on_demand.page)
+    yield snapshot
+    snapshot.close()
+
+
+@pytest.fixture(scope="session")
+def readiness_policy(request) -> ReadinessPolicy:
+    return get_readiness_policy(request.config.getoption("--readiness"))
+
+
+@pytest.fixture(scope="session")
+def locator_manifest(request) -> Generator[LocatorManifest, None, None]:
+    manifest_path = request.config.getoption("--locator-manifest") or os.path.join(
+        request.config.getoption("--act-cache-dir"), "locator_manifest.json"
+    )
+    manifest = LocatorManifest(
+        manifest_path, mode=request.config.getoption("--locator-mode")
+    )
+    yield manifest
+    manifest.save()
+
+
+@pytest.fixture(scope="session")
+def act_cache(request, locator_manifest: LocatorManifest) -> ActCache:
+    return ActCache(
+        cache_dir=request.config.getoption("--act-cache-dir"),
+        model_name=request.config.getoption("--stagehand-model", default="gpt-5-nano"),
+        enabled=not request.config.getoption("--no-act-cache"),
+        manifest=locator_manifest,
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with TIMINGS.measure(FIXTURE, fixturedef.argname):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    with TIMINGS.measure(TEST, item.nodeid):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(PHASE_REPORTS_KEY, {})[report.when] = report
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with TIMINGS.measure(TEARDOWN, item.nodeid):
+        yield
+
+
+def pytest_bdd_before_scenario(request, feature, scenario):
+    # A rerun must not pick up an action deferred by the failed attempt
+    request.node.stash[DEFERRED_ACTIONS_KEY] = []
+    if request.node.get_closest_marker("no_step_retry") is not None:
+        STEP_RETRY_BUDGET.reset(0)
+    else:
+        STEP_RETRY_BUDGET.reset(
+            request.config.getoption("--step-retries"),
+            delay=request.config.getoption("--step-retry-delay"),
+        )
+
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    request.node.stash[NEXT_STEP_KEY] = find_next_step_name(scenario, step)
+    # Manifest entries are keyed by the device and the step text that issued the act() calls
+    request.getfixturevalue("locator_manifest").begin_step(
+        step.name, request.getfixturevalue("device").name
+    )
+    # When steps usually change the page; the next Then query recaptures the snapshot
+    if step.type == "when" and not getattr(step_func, "preserves_snapshot", False):
+        request.getfixturevalue("page_snapshot").invalidate()
+
+
+def pytest_bdd_before_step_call(
+    request, feature, scenario, step, step_func, step_func_args
+):
+    request.node.stash[STEP_START_KEY] = time.perf_counter()
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    _record_step(request, step, passed=True)
+
+
+def pytest_bdd_step_error(
+    request, feature, scenario, step, step_func, step_func_args, exception
+):
+    _record_step(request, step, passed=False)
+
+
+def _record_step(request, step, passed: bool):
+    # A step failing before its call (argument parsing, fixtures) has no start time
+    started = request.node.stash.get(STEP_START_KEY, None)
+    if started is not None:
+        del request.node.stash[STEP_START_KEY]
+    seconds = time.perf_counter() - started if started is not None else None
+    if seconds is not None:
+        TIMINGS.record(STEP, step.name, seconds)
+    artifacts = request.node.stash.get(SCENARIO_ARTIFACTS_KEY, None)
+    if artifacts is not None:
+        artifacts.record_step(step.name, passed, seconds)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    memory = getattr(node, "workeroutput", {}).get("browser_memory")
+    if memory is not None:
+        workers = node.config.stash.setdefault(WORKER_MEMORY_KEY, {})
+        workers[node.gateway.id] = memory
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    workers = dict(config.stash.get(WORKER_MEMORY_KEY, {}))
+    if BROWSER_MEMORY_KEY in config.stash:
+        workers[get_worker_id()] = config.stash[BROWSER_MEMORY_KEY]
+    if workers:
+        terminalreporter.write_sep("-", "browser memory")
+        for worker_id, memory in sorted(workers.items()):
+            terminalreporter.write_line(
+                f"{worker_id}: peak {memory['peak_rss_mb']:.0f} MB, "
+                f"{memory['recycled']} browser(s) recycled"
             )
-            time.sleep(1)
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
-            pass
\ No newline at end of file
+
+    report_dir = config.getoption("--timing-report")
+    if not report_dir or hasattr(config, "workerinput"):
+        return
+    report = build_report(report_dir)
+    terminalreporter.write_sep("-", "timing report")
+    for line in format_summary(report):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Full report: {os.path.abspath(report_dir)}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    report_dir = session.config.getoption("--timing-report")
+    if report_dir:
+        TIMINGS.dump(raw_dump_path(report_dir, get_worker_id()))
+
+    # Sent back to the controller, which reports every worker's peak
+    if hasattr(session.config, "workeroutput"):
+        memory = session.config.stash.get(BROWSER_MEMORY_KEY, None)
+        if memory is not None:
+            session.config.workeroutput["browser_memory"] = memory
+
+    if not hasattr(session.config, "workerinput") and os.path.isdir(
+        session.config.stash[ARTIFACTS_RUN_DIR_KEY]
+    ):
+        prune_run_dirs(_artifacts_root(session.config))
+
+    # Kill browsers of this run whose pool never closed them (crashed or interrupted
+    # workers); browsers of other sessions on the machine are left alone
+    reaped = reap_browsers(all_workers=not hasattr(session.config, "workerinput"))
+    if reaped:
+        print(f"Killed {reaped} orphaned browser process(es)")
@@ -3,7 +3,7 @@ Feature: Header functionality on homepage
   I want to interact with the header elements on the TransGlobal website
   So that I can navigate and access different sections of the website
 
-  @header @header_visibility @smoke
+  @header @header_visibility @smoke @shared_page
   Scenario: All header elements are visible
     Given I navigate to the TransGlobal homepage
     When I look at the header
@@ -80,7 +80,7 @@ Feature: Header functionality on homepage
     Then I should see the language dropdown menu
     And I should see language options in the dropdown
 
-  @header @header_services_dropdown @smoke
+  @header @header_services_dropdown @smoke @shared_page
   Scenario: SERVICES menu has dropdown with submenu items
     Given I navigate to the TransGlobal homepage
     When I hover over "SERVICES" menu item
@@ -0,0 +1,68 @@
+"""
+pytest plugin that runs ``async def`` pytest-bdd steps to completion.
+
+pytest-bdd calls step functions synchronously and ignores what they return, so an async
+step would only create a coroutine: none of its actions would run and its assertions
+could never fail. Before every scenario, each registered async step definition is
+replaced by a sync wrapper that runs it on the session event loop, the loop the async
+fixtures (browser pool, pages) live on.
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Optional
+
+import pytest
+from pytest_bdd.steps import step_function_context_registry
+
+
+class StepLoop:
+    """
+    Event loop async steps are run on; set before every scenario.
+    """
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def run(self, coroutine):
+        if self.loop is None:
+            coroutine.close()
+            raise RuntimeError("No event loop set for async steps")
+        return self.loop.run_until_complete(coroutine)
+
+
+STEP_LOOP = StepLoop()
+
+
+def awaited_step(step_func):
+    """
+    Sync step function that runs the async ``step_func`` to completion on ``STEP_LOOP``.
+    """
+
+    @functools.wraps(step_func)
+    def wrapper(*args, **kwargs):
+        return STEP_LOOP.run(step_func(*args, **kwargs))
+
+    return wrapper
+
+
+def await_async_steps():
+    """
+    Replace every registered ``async def`` step definition by its ``awaited_step``.
+
+    Wrapped steps are sync, so calling it again only wraps newly imported steps.
+    """
+    for context in list(step_function_context_registry.values()):
+        if inspect.iscoroutinefunction(context.step_func):
+            context.step_func = awaited_step(context.step_func)
+
+
+@pytest.fixture(scope="session")
+async def step_event_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def pytest_bdd_before_scenario(request, feature, scenario):
+    await_async_steps()
+    STEP_LOOP.loop = request.getfixturevalue("step_event_loop")
@@ -1,10 +1,64 @@
 import asyncio
-from typing import Union
+import re
+from typing import Dict, Iterable, Optional, Union
+from urllib.parse import urldefrag
 
 from playwright.async_api import Locator, Page
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-
+from tests.pages.base.readiness import (
+    DEFAULT_READINESS,
+    ReadinessPolicy,
+    get_readiness_policy,
+)
+from utils.timing import ACTION, timed_methods
+
+# Field values waited for by _wait_for_field; the patterns are tested by the page's RegExp
+FIELD_HAS_VALUE_PATTERN = re.compile(r"\S")
+FIELD_IS_EMPTY_PATTERN = re.compile(r"^\s*$")
+CLEAR_ATTEMPT_TIMEOUT_MS = 200
+# Unique CSS selector for a field (id, name, else its element path), so the page can look
+# the field up again after a re-render
+FIELD_SELECTOR_SCRIPT = """
+(field) => {
+    const isUnique = (selector) => document.querySelectorAll(selector).length === 1;
+    const tag = field.tagName.toLowerCase();
+    if (field.id && isUnique(`#${CSS.escape(field.id)}`)) {
+        return `#${CSS.escape(field.id)}`;
+    }
+    const name = field.getAttribute("name");
+    if (name && isUnique(`${tag}[name="${CSS.escape(name)}"]`)) {
+        return `${tag}[name="${CSS.escape(name)}"]`;
+    }
+    const path = [];
+    for (let node = field; node.parentElement; node = node.parentElement) {
+        const position = Array.from(node.parentElement.children)
+            .filter((sibling) => sibling.tagName === node.tagName)
+            .indexOf(node) + 1;
+        path.unshift(`${node.tagName.toLowerCase()}:nth-of-type(${position})`);
+    }
+    return `:root > ${path.join(" > ")}`;
+}
+"""
+# Looks the field up on every check, so a stale (re-rendered) field is never read
+FIELD_VALUE_MATCHES_SCRIPT = """
+({ selector, pattern }) => {
+    const field = document.querySelector(selector);
+    return field !== null && new RegExp(pattern).test(field.value);
+}
+"""
+# Finite animations/transitions still running under the element (or the whole document);
+# infinite ones such as spinners and carousels never finish, so they are ignored
+ANIMATIONS_FINISHED_SCRIPT = """
+(element) => (element || document).getAnimations({ subtree: true }).every(
+    (animation) =>
+        animation.playState !== "running" ||
+        animation.effect.getComputedTiming().iterations === Infinity
+)
+"""
+
+
+@timed_methods(ACTION)
 class BaseActions:
     def __init__(self, page: Page, default_timeout: int = 30):
         self.page = page
@@ -14,6 +68,10 @@ class BaseActions:
         await self.page.wait_for_load_state("domcontentloaded")
         await self.page.wait_for_load_state("load")
 
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        return urldefrag(url).url.rstrip("/")
+
     def _resolve_locator(self, locator: Union[Locator, str]) -> Locator:
         """
         Resolve locator to Playwright Locator object.
@@ -46,6 +104,22 @@ class BaseActions:
             url, wait_until="domcontentloaded", timeout=self.default_timeout * 1000
         )
 
+    async def ensure_url(self, url: str) -> bool:
+        """
+        Opens the URL unless the page is already showing it, as happens on a page shared
+        between scenarios.
+
+        Args:
+            url: Full URL to open
+
+        Returns:
+            True if the page was navigated, False if it was already there
+        """
+        if self._normalize_url(self.page.url) == self._normalize_url(url):
+            return False
+        await self.open_url(url)
+        return True
+
     async def find_element(self, locator: Union[Locator, str]):
         resolved_locator = self._resolve_locator(locator)
         await resolved_locator.wait_for(
@@ -75,6 +149,10 @@ class BaseActions:
         resolved_locator = self._resolve_locator(locator)
         await resolved_locator.click(timeout=self.default_timeout * 1000)
 
+    async def hover_element(self, locator: Union[Locator, str]):
+        resolved_locator = self._resolve_locator(locator)
+        await resolved_locator.hover(timeout=self.default_timeout * 1000)
+
     async def click_if_exists(self, locator: Union[Locator, str]):
         if await self.is_element_visible(locator):
             await self.click_element(locator)
@@ -87,24 +165,17 @@ class BaseActions:
         if not current_value or current_value.strip() == "":
             return True
 
-        await resolved_locator.clear()
         max_attempts = 5
-        attempts = 0
-        while attempts < max_attempts:
-            cleared_value = await resolved_locator.input_value()
-            if not cleared_value or cleared_value.strip() == "":
-                return True
-
+        for _ in range(max_attempts):
             await resolved_locator.clear()
-            attempts += 1
-            await self.page.wait_for_timeout(200)
-
-        if attempts == max_attempts:
-            final_value = await resolved_locator.input_value()
-            print(f"警告: 無法清空欄位，當前值: {final_value}")
-            return False
+            if await self._wait_for_field(
+                resolved_locator, FIELD_IS_EMPTY_PATTERN, CLEAR_ATTEMPT_TIMEOUT_MS
+            ):
+                return True
 
-        return True
+        final_value = await resolved_locator.input_value()
+        print(f"警告: 無法清空欄位，當前值: {final_value}")
+        return False
 
     async def send_keys_to_element(self, locator: Union[Locator, str], text: str):
         """
@@ -193,6 +264,43 @@ class BaseActions:
     async def verify_element_visible(self, locator: Union[Locator, str]):
         return await self.is_element_visible(locator)
 
+    async def query_many(
+        self,
+        locators: Iterable[Union[Locator, str]],
+        state: str = "visible",
+        timeout=None,
+    ) -> Dict[Union[Locator, str], bool]:
+        """
+        Wait for several elements concurrently under one shared deadline.
+
+        Args:
+            locators: Playwright Locator objects or CSS selector strings
+            state: Playwright wait state ("visible", "attached", "hidden", "detached")
+            timeout: Shared deadline in seconds, defaults to default_timeout
+
+        Returns:
+            Map of each locator to whether it reached the state before the deadline
+        """
+        locators = list(locators)
+        timeout_ms = (timeout * 1000) if timeout else (self.default_timeout * 1000)
+
+        async def reaches_state(locator: Union[Locator, str]) -> bool:
+            try:
+                await self._resolve_locator(locator).wait_for(
+                    state=state, timeout=timeout_ms
+                )
+                return True
+            except PlaywrightTimeoutError:
+                return False
+
+        results = await asyncio.gather(*(reaches_state(item) for item in locators))
+        return dict(zip(locators, results))
+
+    async def verify_all_visible(
+        self, locators: Iterable[Union[Locator, str]], timeout=None
+    ) -> Dict[Union[Locator, str], bool]:
+        return await self.query_many(locators, state="visible", timeout=timeout)
+
     async def scroll_to_element(self, locator: Union[Locator, str]):
         """
         Note: Playwright's scroll_into_view_if_needed() automatically waits for element to be attached to DOM.
@@ -213,13 +321,39 @@ class BaseActions:
                 f"Element does not disappear in {timeout} seconds: {locator}"
             )
 
-    async def refresh_page(self):
-        await self.page.reload(wait_until="networkidle")
+    async def wait_until_ready(
+        self, readiness: Optional[ReadinessPolicy] = None, timeout=None
+    ) -> bool:
+        """
+        Wait until the current page satisfies a readiness policy.
+
+        Args:
+            readiness: Policy to apply; defaults to the DEFAULT_READINESS policy
+            timeout: Timeout in seconds, defaults to default_timeout
+
+        Returns:
+            True once the page is ready, False if the timeout expires first
+        """
+        readiness = readiness or get_readiness_policy(DEFAULT_READINESS)
+        timeout_ms = (timeout * 1000) if timeout else (self.default_timeout * 1000)
+        try:
+            await readiness.wait(self.page, timeout_ms)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def refresh_page(self, readiness: Optional[ReadinessPolicy] = None):
+        await self.page.reload(wait_until="commit")
+        await self.wait_until_ready(readiness)
 
     async def refresh_and_wait_for_element(
-        self, locator: Union[Locator, str], timeout=10
+        self,
+        locator: Union[Locator, str],
+        timeout=10,
+        readiness: Optional[ReadinessPolicy] = None,
     ):
-        await self.page.reload(wait_until="networkidle")
+        await self.page.reload(wait_until="commit")
+        await self.wait_until_ready(readiness, timeout)
         resolved_locator = self._resolve_locator(locator)
         await resolved_locator.wait_for(state="visible", timeout=timeout * 1000)
 
@@ -229,18 +363,10 @@ class BaseActions:
         await self.wait_for_element_visible(locator)
 
         resolved_locator = self._resolve_locator(locator)
-
-        import time
-
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            try:
-                current_value = await resolved_locator.input_value()
-                if current_value and current_value.strip():
-                    return True
-            except Exception:
-                pass
-            await self.page.wait_for_timeout(100)
+        if await self._wait_for_field(
+            resolved_locator, FIELD_HAS_VALUE_PATTERN, timeout * 1000
+        ):
+            return True
 
         raise PlaywrightTimeoutError(
             f"Element in {timeout} seconds did not get a value: {locator}"
@@ -250,21 +376,125 @@ class BaseActions:
         original_page = self.page
         context = self.page.context
 
-        import time
-
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            pages = context.pages
-            if len(pages) > 1:
-                for page in pages:
-                    if page != original_page and not page.is_closed():
-                        await page.bring_to_front()
-                        await page.wait_for_load_state("domcontentloaded")
-                        await page.wait_for_load_state("load")
-                        return page
-            await self.page.wait_for_timeout(500)
-
-        raise PlaywrightTimeoutError(f"在 {timeout} 秒內未檢測到新窗口打開")
+        new_page = next(
+            (
+                page
+                for page in context.pages
+                if page != original_page and not page.is_closed()
+            ),
+            None,
+        )
+        if new_page is None:
+            try:
+                new_page = await context.wait_for_event("page", timeout=timeout * 1000)
+            except PlaywrightTimeoutError:
+                raise PlaywrightTimeoutError(
+                    f"在 {timeout} 秒內未檢測到新窗口打開"
+                ) from None
+
+        await new_page.bring_to_front()
+        await new_page.wait_for_load_state("domcontentloaded")
+        await new_page.wait_for_load_state("load")
+        return new_page
+
+    async def wait_for_animations_finished(
+        self, locator: Union[Locator, str, None] = None, timeout=None
+    ) -> bool:
+        """
+        Wait until CSS animations and transitions have finished.
+
+        Args:
+            locator: Element whose subtree is watched; None watches the whole document
+            timeout: Timeout in seconds, defaults to default_timeout
+
+        Returns:
+            True once nothing is animating, False if the timeout expires first
+        """
+        timeout_ms = (timeout * 1000) if timeout else (self.default_timeout * 1000)
+        try:
+            element = None
+            if locator is not None:
+                element = await self._resolve_locator(locator).first.element_handle(
+                    timeout=timeout_ms
+                )
+            await self.page.wait_for_function(
+                ANIMATIONS_FINISHED_SCRIPT, arg=element, timeout=timeout_ms
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def wait_for_dropdown_visible(
+        self, locator: Union[Locator, str], timeout=None
+    ) -> bool:
+        """
+        Wait for a dropdown to open: one of its matches is visible and done animating.
+
+        Args:
+            locator: Dropdown container; may match several menus, only one must be visible
+            timeout: Timeout in seconds, defaults to default_timeout
+
+        Returns:
+            True once the dropdown has settled, False if the timeout expires first
+        """
+        timeout_ms = (timeout * 1000) if timeout else (self.default_timeout * 1000)
+        open_dropdown = self._resolve_locator(locator).filter(visible=True).first
+        try:
+            await open_dropdown.wait_for(state="visible", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            return False
+        return await self.wait_for_animations_finished(open_dropdown, timeout)
+
+    async def wait_for_url_change(self, previous_url: str, timeout=None) -> bool:
+        """
+        Wait until the page has committed a navigation away from previous_url.
+
+        Args:
+            previous_url: URL captured before the action that should navigate
+            timeout: Timeout in seconds, defaults to default_timeout
+
+        Returns:
+            True once the URL has changed, False if the timeout expires first
+        """
+        timeout_ms = (timeout * 1000) if timeout else (self.default_timeout * 1000)
+        try:
+            await self.page.wait_for_url(
+                lambda url: url != previous_url, wait_until="commit", timeout=timeout_ms
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def _wait_for_field(
+        self, resolved_locator: Locator, value_pattern: re.Pattern, timeout_ms: float
+    ) -> bool:
+        """
+        Wait until a form field's value matches a pattern, within one deadline.
+
+        The field is looked up again on every animation frame, so a re-rendered field is
+        picked up, and the match is seen on the frame it happens rather than after a
+        back-off interval.
+
+        Returns:
+            True as soon as the value matches, False if the timeout expires first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_ms / 1000
+        try:
+            selector = await resolved_locator.evaluate(
+                FIELD_SELECTOR_SCRIPT, timeout=timeout_ms
+            )
+            # A timeout of 0 would disable the timeout altogether
+            remaining_ms = max((deadline - loop.time()) * 1000, 1)
+            await self.page.wait_for_function(
+                FIELD_VALUE_MATCHES_SCRIPT,
+                arg={"selector": selector, "pattern": value_pattern.pattern},
+                polling="raf",
+                timeout=remaining_ms,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
     async def close_current_window_and_switch_back(self, original_page: Page):
         context = self.page.context
@@ -0,0 +1,39 @@
+from typing import List, Optional
+
+import pytest
+
+# Name of the step that runs after the current one; recorded by conftest before each step
+NEXT_STEP_KEY = pytest.StashKey[Optional[str]]()
+DEFERRED_ACTIONS_KEY = pytest.StashKey[List[str]]()
+
+
+def find_next_step_name(scenario, step) -> Optional[str]:
+    """
+    Name of the step that follows ``step`` in ``scenario``, or None for the last step.
+    """
+    steps = scenario.steps
+    for position, scenario_step in enumerate(steps[:-1]):
+        if scenario_step is step:
+            return steps[position + 1].name
+    return None
+
+
+def next_step_name(request) -> Optional[str]:
+    return request.node.stash.get(NEXT_STEP_KEY, None)
+
+
+def defer_action(request, instruction: str):
+    """
+    Leave an ``act()`` instruction to the next step, so it can be resolved together with
+    that step's own instruction by ``ActCache.act_sequence()``.
+    """
+    request.node.stash.setdefault(DEFERRED_ACTIONS_KEY, []).append(instruction)
+
+
+def take_deferred_actions(request) -> List[str]:
+    """
+    Instructions deferred by earlier steps, in order; they are handed over only once.
+    """
+    deferred = request.node.stash.get(DEFERRED_ACTIONS_KEY, [])
+    request.node.stash[DEFERRED_ACTIONS_KEY] = []
+    return deferred
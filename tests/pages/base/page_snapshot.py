@@ -0,0 +1,156 @@
+from typing import Dict, Iterable, List, Optional, Union
+
+from playwright.async_api import Frame, Locator, Page
+
+from tests.pages.base.base_action import BaseActions
+
+# Resolves every selector in one evaluation. Plain CSS and unquoted "text=" selectors are
+# supported; anything else is left out of the result and answered live by Playwright.
+SNAPSHOT_SCRIPT = """
+(selectors) => {
+    const normalize = (value) => (value || "").replace(/\\s+/g, " ").trim().toLowerCase();
+    const textCache = new Map();
+    const textOf = (element) => {
+        if (!textCache.has(element)) {
+            textCache.set(element, normalize(element.textContent));
+        }
+        return textCache.get(element);
+    };
+    const isVisible = (element) => {
+        const rect = element.getBoundingClientRect();
+        const style = getComputedStyle(element);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+    };
+    const findByText = (text) => {
+        const needle = normalize(text);
+        const skipped = ["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"];
+        // Keep the deepest elements containing the text, like Playwright's text engine
+        return [...document.body.querySelectorAll("*")].filter(
+            (element) =>
+                !skipped.includes(element.tagName) &&
+                textOf(element).includes(needle) &&
+                ![...element.children].some((child) => textOf(child).includes(needle))
+        );
+    };
+    const snapshot = {};
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = selector.startsWith("text=")
+                ? findByText(selector.slice(5))
+                : [...document.querySelectorAll(selector)];
+        } catch (error) {
+            continue;
+        }
+        const visible = elements.filter(isVisible);
+        const first = visible[0] || elements[0];
+        snapshot[selector] = {
+            count: elements.length,
+            visible: visible.length > 0,
+            href: first ? first.getAttribute("href") : null,
+            text: first ? first.innerText : null,
+        };
+    }
+    return snapshot;
+}
+"""
+
+
+def preserves_snapshot(step_func):
+    """
+    Mark a When step that does not change the page, so the scenario snapshot stays valid.
+    """
+    step_func.preserves_snapshot = True
+    return step_func
+
+
+class PageSnapshot:
+    """
+    Per-scenario snapshot of a set of selectors, captured in a single page evaluation.
+
+    Positive answers come from the snapshot. Negative answers, selectors that were not
+    tracked and snapshots invalidated by a navigation or a When step fall back to live
+    ``BaseActions`` queries, so waiting semantics stay the same as before.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self._selectors: List[str] = []
+        self._entries: Optional[Dict[str, dict]] = None
+        page.on("framenavigated", self._on_frame_navigated)
+
+    def track(self, selectors: Iterable[str]):
+        """
+        Register selectors to capture together on the next query.
+
+        Args:
+            selectors: CSS or unquoted ``text=`` selectors used by the scenario's Then steps
+        """
+        self._selectors = list(dict.fromkeys([*self._selectors, *selectors]))
+        self.invalidate()
+
+    def close(self):
+        """
+        Stop listening for navigations; the page may outlive the scenario when it is shared.
+        """
+        self.page.remove_listener("framenavigated", self._on_frame_navigated)
+
+    def invalidate(self):
+        self._entries = None
+
+    async def is_visible(self, locator: Union[Locator, str], timeout=None) -> bool:
+        entry = await self._lookup(locator)
+        if entry is not None and entry["visible"]:
+            return True
+        return await self._live(timeout).verify_element_visible(locator)
+
+    async def are_visible(
+        self, locators: Iterable[Union[Locator, str]], timeout=None
+    ) -> Dict[Union[Locator, str], bool]:
+        """
+        Visibility of several elements; anything not visible in the snapshot is checked
+        live, concurrently, under one shared deadline.
+        """
+        results = {}
+        for locator in locators:
+            entry = await self._lookup(locator)
+            results[locator] = entry is not None and entry["visible"]
+        pending = [locator for locator, is_visible in results.items() if not is_visible]
+        if pending:
+            results.update(await self._live(timeout).verify_all_visible(pending))
+        return results
+
+    async def is_present(self, locator: Union[Locator, str], timeout=3) -> bool:
+        entry = await self._lookup(locator)
+        if entry is not None and entry["count"] > 0:
+            return True
+        return await self._live(timeout).wait_for_element_present(locator, timeout)
+
+    async def get_href(self, locator: Union[Locator, str]) -> Optional[str]:
+        entry = await self._lookup(locator)
+        if entry is not None and entry["count"] > 0:
+            return entry["href"]
+        resolved_locator = self._live(None)._resolve_locator(locator)
+        return await resolved_locator.first.get_attribute("href")
+
+    async def get_text(self, locator: Union[Locator, str]) -> str:
+        entry = await self._lookup(locator)
+        if entry is not None and entry["count"] > 0 and entry["text"] is not None:
+            return entry["text"]
+        return await self._live(None).get_element_text(locator)
+
+    async def _lookup(self, locator: Union[Locator, str]) -> Optional[dict]:
+        if not isinstance(locator, str) or locator not in self._selectors:
+            return None
+        if self._entries is None:
+            self._entries = await self.page.evaluate(SNAPSHOT_SCRIPT, self._selectors)
+        return self._entries.get(locator)
+
+    def _live(self, timeout) -> BaseActions:
+        if timeout:
+            return BaseActions(self.page, default_timeout=timeout)
+        return BaseActions(self.page)
+
+    def _on_frame_navigated(self, frame: Frame):
+        if frame == self.page.main_frame:
+            self.invalidate()
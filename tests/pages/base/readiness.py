@@ -0,0 +1,163 @@
+import asyncio
+import re
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, Set
+
+from playwright.async_api import Page, Request
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Third-party traffic that keeps an ad/analytics-heavy site from ever going network-idle
+DEFAULT_IGNORED_URL_PATTERNS = [
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"googlesyndication\.com",
+    r"doubleclick\.net",
+    r"connect\.facebook\.net",
+    r"facebook\.com/tr",
+    r"hotjar\.com",
+    r"clarity\.ms",
+    r"youtube\.com/(embed|youtubei)",
+    r"\.(woff2?|ttf)(\?|$)",
+]
+NETWORK_IDLE_MS = 500
+
+
+class ReadinessPolicy(ABC):
+    """
+    Condition a page has to meet before a step carries on after a navigation.
+    """
+
+    @abstractmethod
+    async def wait(self, page: Page, timeout_ms: float):
+        """Return once the page is ready; raise a Playwright timeout error otherwise."""
+
+
+class LoadStateReadiness(ReadinessPolicy):
+    """
+    Args:
+        state: Playwright load state ("domcontentloaded", "load" or "networkidle")
+    """
+
+    def __init__(self, state: str = "domcontentloaded"):
+        self.state = state
+
+    async def wait(self, page: Page, timeout_ms: float):
+        await page.wait_for_load_state(self.state, timeout=timeout_ms)
+
+
+class SelectorReadiness(ReadinessPolicy):
+    """
+    Args:
+        selector: Element whose visibility marks the page as usable
+    """
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    async def wait(self, page: Page, timeout_ms: float):
+        await page.locator(self.selector).first.wait_for(
+            state="visible", timeout=timeout_ms
+        )
+
+
+class UrlReadiness(ReadinessPolicy):
+    """
+    Args:
+        predicate: Called with the current URL; the page is ready once it returns True
+    """
+
+    def __init__(self, predicate: Callable[[str], bool]):
+        self.predicate = predicate
+
+    async def wait(self, page: Page, timeout_ms: float):
+        await page.wait_for_url(self.predicate, wait_until="commit", timeout=timeout_ms)
+
+
+class NetworkIdleReadiness(ReadinessPolicy):
+    """
+    Network idle that only counts requests not matching the ignore list.
+
+    Requests are tracked from the start of the wait, so the ones issued before
+    DOMContentLoaded count too; after DOMContentLoaded the page is ready once no tracked
+    request has been in flight for ``idle_ms``.
+
+    Args:
+        ignored_url_patterns: Regular expressions of request URLs that never block readiness
+        idle_ms: Quiet period required before the page counts as idle
+    """
+
+    def __init__(
+        self,
+        ignored_url_patterns: Optional[Iterable[str]] = None,
+        idle_ms: int = NETWORK_IDLE_MS,
+    ):
+        patterns = (
+            DEFAULT_IGNORED_URL_PATTERNS
+            if ignored_url_patterns is None
+            else ignored_url_patterns
+        )
+        self._ignored = [re.compile(pattern) for pattern in patterns]
+        self.idle_ms = idle_ms
+
+    async def wait(self, page: Page, timeout_ms: float):
+        in_flight: Set[Request] = set()
+        changed = asyncio.Event()
+
+        def on_request(request: Request):
+            if not any(pattern.search(request.url) for pattern in self._ignored):
+                in_flight.add(request)
+                changed.set()
+
+        def on_request_done(request: Request):
+            in_flight.discard(request)
+            changed.set()
+
+        page.on("request", on_request)
+        page.on("requestfinished", on_request_done)
+        page.on("requestfailed", on_request_done)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_ms / 1000
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+            await asyncio.wait_for(
+                self._wait_for_quiet(in_flight, changed),
+                timeout=max(deadline - loop.time(), 0),
+            )
+        except asyncio.TimeoutError:
+            pending_urls = sorted(request.url for request in in_flight)[:5]
+            raise PlaywrightTimeoutError(
+                f"Network not idle within {timeout_ms} ms, pending: {pending_urls}"
+            ) from None
+        finally:
+            page.remove_listener("request", on_request)
+            page.remove_listener("requestfinished", on_request_done)
+            page.remove_listener("requestfailed", on_request_done)
+
+    async def _wait_for_quiet(self, in_flight: Set[Request], changed: asyncio.Event):
+        while True:
+            changed.clear()
+            if in_flight:
+                await changed.wait()
+                continue
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=self.idle_ms / 1000)
+            except asyncio.TimeoutError:
+                return
+
+
+DEFAULT_READINESS = "domcontentloaded"
+READINESS_POLICIES = {
+    "domcontentloaded": LoadStateReadiness("domcontentloaded"),
+    "load": LoadStateReadiness("load"),
+    "networkidle": LoadStateReadiness("networkidle"),
+    "network-quiet": NetworkIdleReadiness(),
+}
+
+
+def get_readiness_policy(name: str) -> ReadinessPolicy:
+    if name not in READINESS_POLICIES:
+        raise ValueError(
+            f"Unsupported readiness policy: {name}. "
+            f"Supported policies: {', '.join(READINESS_POLICIES)}"
+        )
+    return READINESS_POLICIES[name]
@@ -0,0 +1,81 @@
+import asyncio
+import functools
+from typing import Optional
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+# Failures worth re-checking on the live page; anything else fails the step right away
+RETRYABLE_ERRORS = (AssertionError, PlaywrightTimeoutError)
+DEFAULT_STEP_ATTEMPTS = 2
+# Wait before the first retry of a step; it doubles for every further retry
+DEFAULT_STEP_RETRY_DELAY = 0.2
+DEFAULT_SCENARIO_RETRY_BUDGET = 2
+
+
+class StepRetryBudget:
+    """
+    Step retries left in the running scenario. Once it is spent, failing steps raise and
+    the scenario escalates to a full rerun (pytest-rerunfailures).
+    """
+
+    def __init__(self):
+        self.remaining = 0
+        self.delay = DEFAULT_STEP_RETRY_DELAY
+
+    def reset(self, retries: int, delay: float = DEFAULT_STEP_RETRY_DELAY):
+        self.remaining = retries
+        self.delay = delay
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+STEP_RETRY_BUDGET = StepRetryBudget()
+
+
+def retryable_step(
+    step_func=None,
+    *,
+    attempts: int = DEFAULT_STEP_ATTEMPTS,
+    delay: Optional[float] = None,
+):
+    """
+    Re-run an idempotent step on the live page when it fails, instead of the whole scenario.
+
+    Only use it on steps that are safe to repeat (assertions, waits). A retry clears the
+    scenario's ``page_snapshot`` so the step sees the page as it is now.
+
+    Args:
+        step_func: Async step function (when used without arguments)
+        attempts: Total attempts for this step, including the first one
+        delay: Seconds to wait before the first retry, doubled for each further one
+            (default: the scenario's --step-retry-delay)
+    """
+
+    def decorate(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except RETRYABLE_ERRORS as e:
+                    if attempt == attempts or not STEP_RETRY_BUDGET.take():
+                        raise
+                    print(
+                        f"⚠️ Step {func.__name__} failed ({type(e).__name__}: {e}), "
+                        f"retrying it ({attempt}/{attempts - 1})"
+                    )
+                    page_snapshot = kwargs.get("page_snapshot")
+                    if page_snapshot is not None:
+                        page_snapshot.invalidate()
+                    base_delay = STEP_RETRY_BUDGET.delay if delay is None else delay
+                    await asyncio.sleep(base_delay * 2 ** (attempt - 1))
+
+        return wrapper
+
+    if step_func is not None:
+        return decorate(step_func)
+    return decorate
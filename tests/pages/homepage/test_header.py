@@ -1,11 +1,77 @@
+import re
+
 import pytest
 from pytest_bdd import given, parsers, scenarios, then, when
 from stagehand import Stagehand
 
 from tests.pages.base.base_action import BaseActions
+from tests.pages.base.deferred_actions import (
+    defer_action,
+    next_step_name,
+    take_deferred_actions,
+)
+from tests.pages.base.page_snapshot import PageSnapshot, preserves_snapshot
+from tests.pages.base.readiness import ReadinessPolicy, UrlReadiness
+from tests.pages.base.step_retry import retryable_step
+from utils.act_cache import ActCache
 
 scenarios("../../../features/homepage/header.feature")
 
+LOGO_LOCATOR = 'a[href*="transglobalus.com"]'
+HOMEPAGE_LOGO_LOCATOR = 'a[href="https://www.transglobalus.com/"]:has(img)'
+LANGUAGE_SELECTOR_LOCATOR = 'a[href="#pll_switcher"]'
+PHONE_LINK_LOCATOR = 'a[href^="tel:"]'
+DROPDOWN_MENU_LOCATOR = '.sub-menu, .dropdown-menu, [class*="submenu"]'
+SETTLE_TIMEOUT = 5
+# A hover right before one of these steps is resolved together with the click
+DROPDOWN_ITEM_STEP = re.compile(r'^I click the ".+" item in the .+ dropdown$')
+HEADER_MENU_ITEMS = [
+    "SERVICES",
+    "EVENTS",
+    "MEDIA",
+    "NEWS",
+    "ABOUT US",
+    "CONTACT US",
+    "Resource",
+    "English",
+]
+SOCIAL_LINK_LOCATORS = {
+    "Facebook": 'a[href*="facebook.com"]',
+    "Twitter": 'a[href*="twitter.com"], a[href*="x.com"]',
+    "LinkedIn": 'a[href*="linkedin.com"]',
+    "YouTube": 'a[href*="youtube.com"]',
+    "Instagram": 'a[href*="instagram.com"]',
+}
+# Captured together in one page evaluation by the scenario's PageSnapshot
+HEADER_SNAPSHOT_SELECTORS = [
+    LOGO_LOCATOR,
+    HOMEPAGE_LOGO_LOCATOR,
+    LANGUAGE_SELECTOR_LOCATOR,
+    PHONE_LINK_LOCATOR,
+    DROPDOWN_MENU_LOCATOR,
+    *[f"text={menu_item}" for menu_item in HEADER_MENU_ITEMS],
+    *SOCIAL_LINK_LOCATORS.values(),
+]
+
+
+async def hover_menu_item(request, page, act_cache: ActCache, instruction: str):
+    """
+    Hover a menu item and wait for its dropdown, or leave the hover to the dropdown
+    click that follows so both are resolved by one model call.
+    """
+    if DROPDOWN_ITEM_STEP.match(next_step_name(request) or ""):
+        defer_action(request, instruction)
+        return
+    await act_cache.act(page, instruction)
+    base_actions = BaseActions(page, default_timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_for_dropdown_visible(DROPDOWN_MENU_LOCATOR)
+
+
+async def click_dropdown_item(request, page, act_cache: ActCache, instruction: str):
+    # No dropdown settle after a batched hover: the click itself waits until the item
+    # is visible and stable before clicking it
+    await act_cache.act_sequence(page, take_deferred_actions(request) + [instruction])
+
 
 # ============================================================================
 # Scenario : All header elements are visible @header @header_visibility
@@ -13,145 +79,107 @@ scenarios("../../../features/homepage/header.feature")
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_visibility(stagehand_on_demand: Stagehand):
+async def navigate_homepage_visibility(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when("I look at the header")
+@preserves_snapshot
 async def look_at_header_visibility(stagehand_on_demand: Stagehand):
-    await stagehand_on_demand.page.wait_for_timeout(500)
+    base_actions = BaseActions(stagehand_on_demand.page, default_timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_for_animations_finished()
 
 
 @then("the TransGlobal logo should be visible")
-async def logo_visible_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    logo_locator = 'a[href*="transglobalus.com"]'
-    is_visible = await base_actions.verify_element_visible(logo_locator)
+async def logo_visible_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(LOGO_LOCATOR)
     assert is_visible
 
 
 @then("the logo should link to the homepage URL")
-async def logo_links_homepage_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    logo_locator = 'a[href="https://www.transglobalus.com/"]'
-    await base_actions.wait_for_element_visible(logo_locator, timeout=5)
-    logo_link = page.locator(logo_locator).filter(has=page.locator("img"))
-    href = await logo_link.get_attribute("href")
+async def logo_links_homepage_visibility(page_snapshot: PageSnapshot):
+    href = await page_snapshot.get_href(HOMEPAGE_LOGO_LOCATOR)
     assert href == "https://www.transglobalus.com/"
 
 
 @then(parsers.parse('I should see the "{menu_item}" menu item'))
-async def see_menu_item_visibility(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
+async def see_menu_item_visibility(page_snapshot: PageSnapshot, menu_item: str):
     menu_locator = f"text={menu_item}"
-    is_visible = await base_actions.verify_element_visible(menu_locator)
+    is_visible = await page_snapshot.is_visible(menu_locator)
     assert is_visible
 
 
 @then(parsers.parse('I should see the "{menu_item}" menu item in the top menu'))
-async def see_top_menu_item_visibility(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
+async def see_top_menu_item_visibility(page_snapshot: PageSnapshot, menu_item: str):
     menu_locator = f"text={menu_item}"
-    is_visible = await base_actions.verify_element_visible(menu_locator)
+    is_visible = await page_snapshot.is_visible(menu_locator)
     assert is_visible
 
 
 @then("the language selector should be visible")
-async def language_selector_visible_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    language_locator = 'a[href="#pll_switcher"]'
-    is_visible = await base_actions.verify_element_visible(language_locator)
+async def language_selector_visible_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(LANGUAGE_SELECTOR_LOCATOR)
     assert is_visible
 
 
 @then(parsers.parse('it should display "{text}"'))
-async def display_text_visibility(stagehand_on_demand: Stagehand, text: str):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
+async def display_text_visibility(page_snapshot: PageSnapshot, text: str):
     text_locator = f"text={text}"
-    is_visible = await base_actions.verify_element_visible(text_locator)
+    is_visible = await page_snapshot.is_visible(text_locator)
     assert is_visible
 
 
 @then("social media links should be visible")
-async def social_media_visible_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    facebook_locator = 'a[href*="facebook.com"]'
-    is_visible = await base_actions.verify_element_visible(facebook_locator)
+async def social_media_visible_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["Facebook"])
     assert is_visible
 
 
 @then("I should see Facebook link")
-async def see_facebook_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    facebook_locator = 'a[href*="facebook.com"]'
-    is_visible = await base_actions.verify_element_visible(facebook_locator)
+async def see_facebook_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["Facebook"])
     assert is_visible
 
 
 @then("I should see Twitter link")
-async def see_twitter_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    twitter_locator = 'a[href*="twitter.com"], a[href*="x.com"]'
-    is_visible = await base_actions.verify_element_visible(twitter_locator)
+async def see_twitter_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["Twitter"])
     assert is_visible
 
 
 @then("I should see LinkedIn link")
-async def see_linkedin_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    linkedin_locator = 'a[href*="linkedin.com"]'
-    is_visible = await base_actions.verify_element_visible(linkedin_locator)
+async def see_linkedin_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["LinkedIn"])
     assert is_visible
 
 
 @then("I should see YouTube link")
-async def see_youtube_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    youtube_locator = 'a[href*="youtube.com"]'
-    is_visible = await base_actions.verify_element_visible(youtube_locator)
+async def see_youtube_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["YouTube"])
     assert is_visible
 
 
 @then("I should see Instagram link")
-async def see_instagram_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    instagram_locator = 'a[href*="instagram.com"]'
-    is_visible = await base_actions.verify_element_visible(instagram_locator)
+async def see_instagram_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(SOCIAL_LINK_LOCATORS["Instagram"])
     assert is_visible
 
 
 @then("the phone link should be visible")
-async def phone_link_visible_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    phone_locator = 'a[href^="tel:"]'
-    is_visible = await base_actions.verify_element_visible(phone_locator)
+async def phone_link_visible_visibility(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(PHONE_LINK_LOCATOR)
     assert is_visible
 
 
 @then("it should be clickable")
-async def phone_link_clickable_visibility(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page)
-    phone_locator = 'a[href^="tel:"]'
-    await base_actions.wait_for_element_visible(phone_locator, timeout=5)
-    phone_link = page.locator(phone_locator).first()
-    href = await phone_link.get_attribute("href")
+async def phone_link_clickable_visibility(page_snapshot: PageSnapshot):
+    href = await page_snapshot.get_href(PHONE_LINK_LOCATOR)
     assert href and href.startswith("tel:")
 
 
@@ -161,26 +189,39 @@ async def phone_link_clickable_visibility(stagehand_on_demand: Stagehand):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_contact(stagehand_on_demand: Stagehand):
+async def navigate_homepage_contact(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I click the "{menu_item}" menu item in the header'))
-async def click_contact_menu_item(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{menu_item}" in the header')
-    await page.wait_for_load_state("networkidle")
+async def click_contact_menu_item(
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    menu_item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await act_cache.act(page, f'click the "{menu_item}" in the header')
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the contact page")
-async def navigated_to_contact_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_contact_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "contact" in current_url.lower()
     body_locator = "body"
@@ -190,9 +231,13 @@ async def navigated_to_contact_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text}"'))
+@retryable_step
 async def url_contains_contact(stagehand_on_demand: Stagehand, text: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(lambda url: text.lower() in url.lower())
+    )
     current_url = page.url
     assert text.lower() in current_url.lower()
 
@@ -203,26 +248,39 @@ async def url_contains_contact(stagehand_on_demand: Stagehand, text: str):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_media(stagehand_on_demand: Stagehand):
+async def navigate_homepage_media(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I click the "{menu_item}" menu item in the header'))
-async def click_media_menu_item(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{menu_item}" in the header')
-    await page.wait_for_load_state("networkidle")
+async def click_media_menu_item(
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    menu_item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await act_cache.act(page, f'click the "{menu_item}" in the header')
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the media page")
-async def navigated_to_media_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_media_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "media" in current_url.lower() or "transglobaltv" in current_url.lower()
     body_locator = "body"
@@ -232,9 +290,15 @@ async def navigated_to_media_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text1}" or "{text2}"'))
+@retryable_step
 async def url_contains_media_or(stagehand_on_demand: Stagehand, text1: str, text2: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(
+            lambda url: text1.lower() in url.lower() or text2.lower() in url.lower()
+        )
+    )
     current_url = page.url
     assert text1.lower() in current_url.lower() or text2.lower() in current_url.lower()
 
@@ -245,26 +309,39 @@ async def url_contains_media_or(stagehand_on_demand: Stagehand, text1: str, text
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_news(stagehand_on_demand: Stagehand):
+async def navigate_homepage_news(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I click the "{menu_item}" menu item in the header'))
-async def click_news_menu_item(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{menu_item}" in the header')
-    await page.wait_for_load_state("networkidle")
+async def click_news_menu_item(
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    menu_item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await act_cache.act(page, f'click the "{menu_item}" in the header')
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the news page")
-async def navigated_to_news_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_news_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "news" in current_url.lower()
     body_locator = "body"
@@ -274,9 +351,13 @@ async def navigated_to_news_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text}"'))
+@retryable_step
 async def url_contains_news(stagehand_on_demand: Stagehand, text: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(lambda url: text.lower() in url.lower())
+    )
     current_url = page.url
     assert text.lower() in current_url.lower()
 
@@ -287,33 +368,54 @@ async def url_contains_news(stagehand_on_demand: Stagehand, text: str):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_events(stagehand_on_demand: Stagehand):
+async def navigate_homepage_events(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I hover over "{menu_item}" menu item'))
-async def hover_click_events_menu(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'hover over "{menu_item}" in the header')
-    await page.wait_for_timeout(1000)
+async def hover_click_events_menu(
+    request, stagehand_on_demand: Stagehand, act_cache: ActCache, menu_item: str
+):
+    await hover_menu_item(
+        request,
+        stagehand_on_demand.page,
+        act_cache,
+        f'hover over "{menu_item}" in the header',
+    )
 
 
 @when(parsers.parse('I click the "{item}" item in the EVENTS dropdown'))
-async def click_events_dropdown_item(stagehand_on_demand: Stagehand, item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{item}" item in the EVENTS dropdown menu')
-    await page.wait_for_load_state("networkidle")
+async def click_events_dropdown_item(
+    request,
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await click_dropdown_item(
+        request, page, act_cache, f'click the "{item}" item in the EVENTS dropdown menu'
+    )
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the webinar page")
-async def navigated_to_webinar_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_webinar_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "seminars" in current_url.lower()
     body_locator = "body"
@@ -323,9 +425,13 @@ async def navigated_to_webinar_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text}"'))
+@retryable_step
 async def url_contains_seminars(stagehand_on_demand: Stagehand, text: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(lambda url: text.lower() in url.lower())
+    )
     current_url = page.url
     assert text.lower() in current_url.lower()
 
@@ -336,34 +442,57 @@ async def url_contains_seminars(stagehand_on_demand: Stagehand, text: str):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_about_us(stagehand_on_demand: Stagehand):
+async def navigate_homepage_about_us(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I hover over "{menu_item}" menu item'))
-async def hover_click_about_us_menu(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'hover over or click the "{menu_item}" menu item in the header')
-    await page.wait_for_timeout(1000)
+async def hover_click_about_us_menu(
+    request, stagehand_on_demand: Stagehand, act_cache: ActCache, menu_item: str
+):
+    await hover_menu_item(
+        request,
+        stagehand_on_demand.page,
+        act_cache,
+        f'hover over or click the "{menu_item}" menu item in the header',
+    )
 
 
 @when(parsers.parse('I click the "{item}" item in the ABOUT US dropdown'))
-async def click_about_us_dropdown_item(stagehand_on_demand: Stagehand, item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{item}" item in the ABOUT US dropdown menu')
-    await page.wait_for_load_state("networkidle")
-    await page.wait_for_timeout(2000)
+async def click_about_us_dropdown_item(
+    request,
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await click_dropdown_item(
+        request,
+        page,
+        act_cache,
+        f'click the "{item}" item in the ABOUT US dropdown menu',
+    )
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the about us page")
-async def navigated_to_about_us_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_about_us_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "about-us" in current_url.lower()
     body_locator = "body"
@@ -373,9 +502,13 @@ async def navigated_to_about_us_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text}"'))
+@retryable_step
 async def url_contains_about_us(stagehand_on_demand: Stagehand, text: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(lambda url: text.lower() in url.lower())
+    )
     current_url = page.url
     assert text.lower() in current_url.lower()
 
@@ -386,33 +519,57 @@ async def url_contains_about_us(stagehand_on_demand: Stagehand, text: str):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_resource(stagehand_on_demand: Stagehand):
+async def navigate_homepage_resource(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I hover over "{menu_item}" menu item in the top menu'))
-async def hover_click_resource_menu(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'hover over or click the "{menu_item}" menu item in the top menu')
-    await page.wait_for_timeout(1000)
+async def hover_click_resource_menu(
+    request, stagehand_on_demand: Stagehand, act_cache: ActCache, menu_item: str
+):
+    await hover_menu_item(
+        request,
+        stagehand_on_demand.page,
+        act_cache,
+        f'hover over or click the "{menu_item}" menu item in the top menu',
+    )
 
 
 @when(parsers.parse('I click the "{item}" item in the Resource dropdown'))
-async def click_resource_dropdown_item(stagehand_on_demand: Stagehand, item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'click the "{item}" item in the Resource dropdown menu')
-    await page.wait_for_load_state("networkidle")
+async def click_resource_dropdown_item(
+    request,
+    stagehand_on_demand: Stagehand,
+    act_cache: ActCache,
+    item: str,
+    readiness_policy: ReadinessPolicy,
+):
+    page = stagehand_on_demand.page
+    previous_url = page.url
+    await click_dropdown_item(
+        request,
+        page,
+        act_cache,
+        f'click the "{item}" item in the Resource dropdown menu',
+    )
+    base_actions = BaseActions(page)
+    await base_actions.wait_for_url_change(previous_url, timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_until_ready(readiness_policy)
 
 
 @then("I should be navigated to the agent portal page")
-async def navigated_to_agent_portal_page(stagehand_on_demand: Stagehand):
+@retryable_step
+async def navigated_to_agent_portal_page(
+    stagehand_on_demand: Stagehand, readiness_policy: ReadinessPolicy
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.wait_for_page_loaded()
-    await page.wait_for_timeout(1000)
+    await base_actions.wait_until_ready(readiness_policy)
     current_url = page.url
     assert "tgpt.transglobalus.com" in current_url.lower()
     try:
@@ -425,9 +582,13 @@ async def navigated_to_agent_portal_page(stagehand_on_demand: Stagehand):
 
 
 @then(parsers.parse('the URL should contain "{text}"'))
+@retryable_step
 async def url_contains_tgpt(stagehand_on_demand: Stagehand, text: str):
     page = stagehand_on_demand.page
-    await page.wait_for_load_state("networkidle")
+    base_actions = BaseActions(page)
+    await base_actions.wait_until_ready(
+        UrlReadiness(lambda url: text.lower() in url.lower())
+    )
     current_url = page.url
     assert text.lower() in current_url.lower()
 
@@ -438,21 +599,26 @@ async def url_contains_tgpt(stagehand_on_demand: Stagehand, text: str):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_language(stagehand_on_demand: Stagehand):
+async def navigate_homepage_language(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when("I click the language selector in the header")
-async def click_language_selector(stagehand_on_demand: Stagehand):
+async def click_language_selector(stagehand_on_demand: Stagehand, act_cache: ActCache):
     page = stagehand_on_demand.page
-    await page.act("click the language selector in the header")
-    await page.wait_for_timeout(1000)
+    await act_cache.act(page, "click the language selector in the header")
+    base_actions = BaseActions(page, default_timeout=SETTLE_TIMEOUT)
+    await base_actions.wait_for_animations_finished()
 
 
 @then("I should see the language dropdown menu")
+@retryable_step
 async def see_language_dropdown(stagehand_on_demand: Stagehand):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page, default_timeout=3)
@@ -468,6 +634,7 @@ async def see_language_dropdown(stagehand_on_demand: Stagehand):
 
 
 @then("I should see language options in the dropdown")
+@retryable_step
 async def see_language_options(stagehand_on_demand: Stagehand):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page, default_timeout=3)
@@ -482,30 +649,37 @@ async def see_language_options(stagehand_on_demand: Stagehand):
 
 
 @given("I navigate to the TransGlobal homepage")
-async def navigate_homepage_services(stagehand_on_demand: Stagehand):
+async def navigate_homepage_services(
+    stagehand_on_demand: Stagehand, page_snapshot: PageSnapshot
+):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page)
-    await base_actions.open_url("https://www.transglobalus.com/")
+    await base_actions.ensure_url("https://www.transglobalus.com/")
     await base_actions.wait_for_page_loaded()
+    page_snapshot.track(HEADER_SNAPSHOT_SELECTORS)
 
 
 @when(parsers.parse('I hover over "{menu_item}" menu item'))
-async def hover_click_services_menu(stagehand_on_demand: Stagehand, menu_item: str):
-    page = stagehand_on_demand.page
-    await page.act(f'hover over "{menu_item}" in the header')
-    await page.wait_for_timeout(1000)
+async def hover_click_services_menu(
+    request, stagehand_on_demand: Stagehand, act_cache: ActCache, menu_item: str
+):
+    await hover_menu_item(
+        request,
+        stagehand_on_demand.page,
+        act_cache,
+        f'hover over "{menu_item}" in the header',
+    )
 
 
 @then("I should see the dropdown menu")
-async def see_dropdown_menu_services(stagehand_on_demand: Stagehand):
-    page = stagehand_on_demand.page
-    base_actions = BaseActions(page, default_timeout=3)
-    dropdown_locator = '.sub-menu, .dropdown-menu, [class*="submenu"]'
-    is_visible = await base_actions.verify_element_visible(dropdown_locator)
+@retryable_step
+async def see_dropdown_menu_services(page_snapshot: PageSnapshot):
+    is_visible = await page_snapshot.is_visible(DROPDOWN_MENU_LOCATOR, timeout=3)
     assert is_visible
 
 
 @then(parsers.parse('I should see "{item}" in the dropdown'))
+@retryable_step
 async def see_item_in_dropdown_services(stagehand_on_demand: Stagehand, item: str):
     page = stagehand_on_demand.page
     base_actions = BaseActions(page, default_timeout=5)
@@ -0,0 +1,154 @@
+import json
+
+from stagehand.schemas import ActResult, ObserveResult
+
+from utils.act_cache import ActCache
+
+HOVER_AND_CLICK = ['hover over "EVENTS" in the header', 'click the "Webinar" item']
+
+
+class FakePage:
+    """
+    Stagehand page stand-in: observe() returns ``observed`` actions, act() fails on the
+    selectors in ``failing``, and every call is logged.
+    """
+
+    def __init__(self, fingerprint="home", observed=2, failing=()):
+        self.fingerprint = fingerprint
+        self.observed = observed
+        self.failing = set(failing)
+        self.calls = []
+
+    async def evaluate(self, script, *args):
+        return self.fingerprint
+
+    async def observe(self, instruction):
+        self.calls.append("observe")
+        return [
+            ObserveResult(
+                selector=f"xpath=/html/body/a[{position}]",
+                description=f"link {position}",
+                method="hover" if position == 0 else "click",
+                arguments=[],
+            )
+            for position in range(self.observed)
+        ]
+
+    async def act(self, action):
+        if isinstance(action, str):
+            self.calls.append("act-instruction")
+            return ActResult(success=True, message="", action=action)
+        self.calls.append(action.selector)
+        return ActResult(
+            success=action.selector not in self.failing,
+            message="",
+            action=action.description,
+        )
+
+
+async def test_replays_cached_action_without_model_call(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    await act_cache.act(FakePage(), "click NEWS")
+
+    page = FakePage()
+    result = await act_cache.act(page, "click NEWS")
+
+    assert result.success
+    assert page.calls == ["xpath=/html/body/a[0]"]
+
+
+async def test_cached_entry_drops_backend_node_id(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    await act_cache.act(FakePage(), "click NEWS")
+
+    (entry_path,) = (tmp_path / "act").iterdir()
+    assert "backend_node_id" not in json.loads(entry_path.read_text())
+
+
+async def test_key_depends_on_page_fingerprint_and_model(tmp_path):
+    await ActCache(str(tmp_path), "model").act(FakePage(), "click NEWS")
+
+    other_page = FakePage(fingerprint="contact")
+    await ActCache(str(tmp_path), "model").act(other_page, "click NEWS")
+    other_model_page = FakePage()
+    await ActCache(str(tmp_path), "other-model").act(other_model_page, "click NEWS")
+
+    assert other_page.calls[0] == "observe"
+    assert other_model_page.calls[0] == "observe"
+
+
+async def test_failed_replay_evicts_and_resolves_again(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    await act_cache.act(FakePage(), "click NEWS")
+
+    page = FakePage(failing={"xpath=/html/body/a[0]"})
+    result = await act_cache.act(page, "click NEWS")
+
+    assert not result.success
+    assert page.calls == ["xpath=/html/body/a[0]", "observe", "xpath=/html/body/a[0]"]
+    assert list((tmp_path / "act").iterdir()) == []
+
+
+async def test_disabled_cache_always_asks_the_model(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model", enabled=False)
+    page = FakePage()
+
+    await act_cache.act(page, "click NEWS")
+    await act_cache.act(page, "click NEWS")
+
+    assert page.calls == ["act-instruction", "act-instruction"]
+
+
+async def test_sequence_is_planned_once_and_replayed(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    first_page = FakePage()
+    await act_cache.act_sequence(first_page, HOVER_AND_CLICK)
+
+    page = FakePage()
+    results = await act_cache.act_sequence(page, HOVER_AND_CLICK)
+
+    assert first_page.calls.count("observe") == 1
+    assert [result.success for result in results] == [True, True]
+    assert page.calls == ["xpath=/html/body/a[0]", "xpath=/html/body/a[1]"]
+
+
+async def test_short_plan_falls_back_per_step_and_is_remembered(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    await act_cache.act_sequence(FakePage(observed=1), HOVER_AND_CLICK)
+
+    page = FakePage(observed=1)
+    results = await act_cache.act_sequence(page, HOVER_AND_CLICK)
+
+    assert len(results) == 2
+    # Both steps come from the single-action cache; the batched plan is not asked again
+    assert "observe" not in page.calls
+
+
+async def test_failed_plan_step_is_resolved_on_its_own(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    page = FakePage(failing={"xpath=/html/body/a[1]"})
+
+    results = await act_cache.act_sequence(page, HOVER_AND_CLICK)
+
+    assert len(results) == 2
+    assert page.calls == [
+        "observe",
+        "xpath=/html/body/a[0]",
+        "xpath=/html/body/a[1]",
+        "observe",
+        "xpath=/html/body/a[0]",
+    ]
+
+
+async def test_failed_fresh_plan_is_remembered_as_step_by_step(tmp_path):
+    act_cache = ActCache(str(tmp_path), "model")
+    await act_cache.act_sequence(
+        FakePage(failing={"xpath=/html/body/a[1]"}), HOVER_AND_CLICK
+    )
+
+    page = FakePage(failing={"xpath=/html/body/a[1]"})
+    results = await act_cache.act_sequence(page, HOVER_AND_CLICK)
+
+    assert [result.success for result in results] == [True, True]
+    # Only the first step asks the model on its own; the failing plan is not run again
+    assert page.calls == ["observe", "xpath=/html/body/a[0]", "xpath=/html/body/a[0]"]
@@ -0,0 +1,101 @@
+import json
+import os
+
+from utils.artifacts import (
+    ArtifactBudget,
+    ScenarioArtifacts,
+    new_run_dir,
+    prune_run_dirs,
+)
+
+
+class FakeTracing:
+    def __init__(self):
+        self.stopped_paths = []
+
+    async def start(self, **options):
+        pass
+
+    async def start_chunk(self, **options):
+        pass
+
+    async def stop_chunk(self, path=None):
+        self.stopped_paths.append(path)
+        if path is not None:
+            with open(path, "wb") as trace_file:
+                trace_file.write(b"trace")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class FakePage:
+    url = "https://www.transglobalus.com/"
+
+    async def screenshot(self, full_page):
+        return b"png"
+
+    async def content(self):
+        return "<html></html>"
+
+
+async def finish_scenario(run_dir, failed, trace=False, max_bytes=10**6):
+    artifacts = ScenarioArtifacts(
+        FakeContext(),
+        FakePage(),
+        "tests/test_header.py::test_news[desktop]",
+        ArtifactBudget(run_dir, max_bytes),
+        trace=trace,
+    )
+    await artifacts.start()
+    artifacts.record_step("I click NEWS", passed=not failed, seconds=0.5)
+    await artifacts.finish(failed=failed)
+    return artifacts
+
+
+async def test_passing_scenario_writes_nothing(tmp_path):
+    run_dir = new_run_dir(str(tmp_path))
+
+    artifacts = await finish_scenario(run_dir, failed=False, trace=True)
+
+    assert not os.path.exists(run_dir)
+    assert artifacts.context.tracing.stopped_paths == [None]
+
+
+async def test_failing_scenario_flushes_into_the_run_dir(tmp_path):
+    run_dir = new_run_dir(str(tmp_path))
+
+    artifacts = await finish_scenario(run_dir, failed=True, trace=True)
+
+    assert os.path.dirname(artifacts.directory) == run_dir
+    assert sorted(os.listdir(artifacts.directory)) == [
+        "dom.html",
+        "screenshot.png",
+        "steps.json",
+        "trace.zip",
+    ]
+    with open(os.path.join(artifacts.directory, "steps.json")) as steps_file:
+        assert json.load(steps_file)[0]["step"] == "I click NEWS"
+
+
+async def test_size_cap_stops_flushing(tmp_path):
+    run_dir = new_run_dir(str(tmp_path))
+
+    artifacts = await finish_scenario(run_dir, failed=True, max_bytes=0)
+
+    assert not os.path.exists(artifacts.directory)
+
+
+def test_prune_keeps_newest_runs_and_foreign_files(tmp_path):
+    run_names = [f"run-2026101{day}-120000-42" for day in range(1, 5)]
+    for name in run_names + ["notes"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "important.txt").write_text("keep")
+
+    prune_run_dirs(str(tmp_path), keep=2)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        run_names[2:] + ["notes", "important.txt"]
+    )
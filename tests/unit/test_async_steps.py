@@ -0,0 +1,55 @@
+import pytest
+
+FEATURE = """\
+Feature: Async steps
+  Scenario: Passing step
+    Given a value of 1
+    Then the value should be 1
+
+  Scenario: Failing step
+    Given a value of 1
+    Then the value should be 2
+"""
+
+STEPS = """\
+import asyncio
+
+from pytest_bdd import given, parsers, scenarios, then
+
+scenarios("async_steps.feature")
+
+
+@given(parsers.parse("a value of {value:d}"), target_fixture="value")
+async def a_value(value):
+    await asyncio.sleep(0)
+    return value
+
+
+@then(parsers.parse("the value should be {expected:d}"))
+async def value_should_be(value, expected):
+    await asyncio.sleep(0)
+    assert value == expected
+"""
+
+
+@pytest.fixture
+def bdd_project(pytester):
+    pytester.makeini("""
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = session
+        asyncio_default_test_loop_scope = session
+        """)
+    pytester.makeconftest('pytest_plugins = ["tests.pages.base.async_steps"]')
+    pytester.makefile(".feature", async_steps=FEATURE)
+    pytester.makepyfile(test_async_steps=STEPS)
+    return pytester
+
+
+def test_failing_async_step_fails_the_run(bdd_project):
+    result = bdd_project.runpytest("-p", "no:cacheprovider")
+
+    # The benchmark runner treats a non-zero exit code as a failed benchmark run
+    result.assert_outcomes(passed=1, failed=1)
+    assert result.ret == pytest.ExitCode.TESTS_FAILED
+    result.stdout.fnmatch_lines(["*assert 1 == 2*"])
@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils.duration_scheduler import (
+    DEFAULT_DURATION,
+    DurationPlugin,
+    DurationScheduling,
+    DurationStore,
+    device_of,
+)
+
+
+class FakeConfig:
+    def __init__(self, workers):
+        self.workers = workers
+
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class FakeNode:
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def make_store(tmp_path, durations):
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps(durations))
+    return DurationStore(str(path))
+
+
+def start_scheduler(store, collection, workers=2):
+    scheduler = DurationScheduling(FakeConfig(workers), store)
+    nodes = [FakeNode(f"gw{position}") for position in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+@pytest.mark.parametrize(
+    "nodeid, expected_device",
+    [
+        ("tests/test_header.py::test_news[ipad]", "ipad"),
+        ("tests/test_header.py::test_news[Webinar-mobile]", "mobile"),
+        ("tests/test_header.py::test_news[Webinar]", None),
+        ("tests/test_header.py::test_news", None),
+    ],
+)
+def test_device_of(nodeid, expected_device):
+    assert device_of(nodeid) == expected_device
+
+
+def test_estimate_falls_back_to_average_then_default(tmp_path):
+    assert (
+        DurationStore(str(tmp_path / "missing.json")).estimate("a") == DEFAULT_DURATION
+    )
+
+    store = make_store(tmp_path, {"a": 10.0, "b": 20.0})
+
+    assert store.estimate("a") == 10.0
+    assert store.estimate("new") == 15.0
+
+
+def test_update_smooths_and_save_round_trips(tmp_path):
+    store = make_store(tmp_path, {"a": 10.0})
+    store.update("a", 20.0)
+    store.update("b", 4.0)
+    store.save()
+
+    assert DurationStore(store.path).durations == {"a": 15.0, "b": 4.0}
+
+
+def test_unreadable_history_is_ignored(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+
+    assert DurationStore(str(path)).durations == {}
+
+
+def test_longest_tests_are_dealt_first(tmp_path):
+    collection = ["short", "long", "medium", "longest"]
+    store = make_store(
+        tmp_path, {"short": 1.0, "long": 30.0, "medium": 10.0, "longest": 60.0}
+    )
+
+    _, (first, second) = start_scheduler(store, collection)
+
+    assert [collection[index] for index in first.sent] == ["longest", "medium"]
+    assert [collection[index] for index in second.sent] == ["long", "short"]
+
+
+def test_worker_prefers_its_last_device(tmp_path):
+    collection = ["a[desktop]", "b[ipad]", "c[desktop]", "d[ipad]"]
+    store = make_store(
+        tmp_path,
+        {"a[desktop]": 40.0, "b[ipad]": 30.0, "c[desktop]": 20.0, "d[ipad]": 10.0},
+    )
+
+    scheduler, (node,) = start_scheduler(store, collection, workers=1)
+    scheduler.node2pending[node].clear()
+    scheduler.check_schedule(node)
+
+    # c[desktop] goes ahead of the longer b[ipad] while the worker is on desktop
+    assert [collection[index] for index in node.sent] == [
+        "a[desktop]",
+        "c[desktop]",
+        "b[ipad]",
+        "d[ipad]",
+    ]
+
+
+def test_plugin_records_whole_test_time_except_skips(tmp_path):
+    store = make_store(tmp_path, {})
+    plugin = DurationPlugin(store, schedule=False)
+
+    for when, duration in [("setup", 1.0), ("call", 5.0), ("teardown", 0.5)]:
+        plugin.pytest_runtest_logreport(
+            SimpleNamespace(nodeid="ran", when=when, duration=duration, skipped=False)
+        )
+    for when, skipped in [("setup", True), ("teardown", False)]:
+        plugin.pytest_runtest_logreport(
+            SimpleNamespace(nodeid="skipped", when=when, duration=0.1, skipped=skipped)
+        )
+
+    assert store.durations == {"ran": 6.5}
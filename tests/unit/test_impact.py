@@ -0,0 +1,151 @@
+import subprocess
+from types import SimpleNamespace
+
+from utils.impact import ImpactIndex, changed_lines, index_key, select
+
+STEPS_SOURCE = """\
+import pytest
+
+TIMEOUT = 5
+
+
+def click_news():
+    return "news"
+
+
+class Header:
+    def open_events(self):
+        return "events"
+
+    def _locator(self):
+        return "a"
+
+
+def hover_menu_item():
+    return "hover"
+"""
+
+FEATURE = "features/header.feature"
+STEPS = "tests/test_header.py"
+
+
+def make_index(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / STEPS).write_text(STEPS_SOURCE)
+    index = ImpactIndex(str(tmp_path / "impact.json"))
+    index.tests = {
+        "tests/test_header.py::test_news": {
+            "feature": FEATURE,
+            "lines": [10, 14],
+            "units": [f"{STEPS}::click_news"],
+        },
+        "tests/test_header.py::test_events": {
+            "feature": FEATURE,
+            "lines": [20, 25],
+            "units": [f"{STEPS}::Header.open_events"],
+        },
+    }
+    return index
+
+
+def test_index_key_drops_parameters():
+    assert index_key("tests/test_header.py::test_news[ipad]") == (
+        "tests/test_header.py::test_news"
+    )
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = make_index(tmp_path)
+    index.save()
+
+    loaded = ImpactIndex(index.path)
+
+    assert loaded.load()
+    assert loaded.tests == index.tests
+    assert not ImpactIndex(str(tmp_path / "missing.json")).load()
+
+
+def test_changed_function_selects_scenarios_that_ran_it(tmp_path):
+    index = make_index(tmp_path)
+
+    assert index.affected({STEPS: {7}}, str(tmp_path)) == {
+        "tests/test_header.py::test_news"
+    }
+    assert index.affected({STEPS: {12}}, str(tmp_path)) == {
+        "tests/test_header.py::test_events"
+    }
+
+
+def test_unrecorded_function_selects_every_user_of_the_file(tmp_path):
+    index = make_index(tmp_path)
+
+    # Neither the private method nor the module-level helper was ever recorded
+    assert index.affected({STEPS: {15}}, str(tmp_path)) == set(index.tests)
+    assert index.affected({STEPS: {19}}, str(tmp_path)) == set(index.tests)
+    assert index.affected({STEPS: {7, 19}}, str(tmp_path)) == set(index.tests)
+
+
+def test_module_level_change_selects_every_user_of_the_file(tmp_path):
+    index = make_index(tmp_path)
+
+    assert index.affected({STEPS: {3}}, str(tmp_path)) == set(index.tests)
+
+
+def test_feature_lines_select_their_scenario(tmp_path):
+    index = make_index(tmp_path)
+
+    # A step appended below the last recorded one still belongs to that scenario
+    assert index.affected({FEATURE: {15}}, str(tmp_path)) == {
+        "tests/test_header.py::test_news"
+    }
+    assert index.affected({FEATURE: {2}}, str(tmp_path)) == set(index.tests)
+
+
+def test_unindexed_and_ignored_changes(tmp_path):
+    index = make_index(tmp_path)
+    root_dir = str(tmp_path)
+
+    assert index.affected({"README.md": {1}}, root_dir) == set()
+    assert index.affected({"features/new.feature": {1}}, root_dir) == set()
+    assert index.affected({"conftest.py": {1}}, root_dir) is None
+
+
+def test_select_keeps_new_items_in_order(tmp_path):
+    index = make_index(tmp_path)
+    items = [
+        SimpleNamespace(nodeid="tests/test_header.py::test_new[desktop]"),
+        SimpleNamespace(nodeid="tests/test_header.py::test_events[desktop]"),
+        SimpleNamespace(nodeid="tests/test_header.py::test_news[desktop]"),
+    ]
+
+    selected = select(items, index, {STEPS: {7}}, str(tmp_path))
+    everything = select(items, index, {"conftest.py": {1}}, str(tmp_path))
+
+    assert selected == [items[0], items[2]]
+    assert everything == items
+
+
+def test_changed_lines_reads_hunks_from_git(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    (tmp_path / "steps.py").write_text("one\ntwo\nthree\nfour\n")
+    (tmp_path / "gone.py").write_text("gone\n")
+    git("init", "-q")
+    git("add", ".")
+    git(
+        "-c",
+        "user.name=test",
+        "-c",
+        "user.email=test@example.com",
+        "commit",
+        "-qm",
+        "base",
+    )
+    (tmp_path / "steps.py").write_text("one\nTWO\nthree\n")
+    (tmp_path / "gone.py").unlink()
+
+    changes = changed_lines("HEAD", str(tmp_path))
+
+    # Line 2 was edited; the deleted fourth line reports its neighbours 3 and 4
+    assert changes == {"steps.py": {2, 3, 4}, "gone.py": set()}
@@ -0,0 +1,22 @@
+import json
+import os
+
+from utils.json_file import write_json_atomic
+
+
+def test_write_json_atomic_creates_directory_and_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "cache" / "entry.json"
+
+    write_json_atomic(str(path), {"b": 1, "a": [2]}, sort_keys=True)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": [2], "b": 1}
+    assert os.listdir(path.parent) == ["entry.json"]
+
+
+def test_write_json_atomic_replaces_existing_file(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text('{"old": true}', encoding="utf-8")
+
+    write_json_atomic(str(path), {"new": True}, indent=2)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"new": True}
@@ -0,0 +1,104 @@
+import json
+
+from playwright.async_api import Error as PlaywrightError
+from stagehand.schemas import ObserveResult
+
+from utils.locator_manifest import COMPILE_MODE, FAST_MODE, LocatorManifest
+
+STEP = 'I click the "NEWS" menu item in the header'
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    async def count(self):
+        return 1
+
+    async def click(self, timeout=None):
+        if self.selector in self.page.missing:
+            raise PlaywrightError(f"Timeout waiting for {self.selector}")
+        self.page.clicked.append(self.selector)
+
+
+class FakePage:
+    """
+    Page whose only stable selector for an XPath is ``a[href="<xpath>"]``.
+    """
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.clicked = []
+
+    async def evaluate(self, script, xpath):
+        return [f'a[href="{xpath}"]']
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+def click_action(xpath):
+    return ObserveResult(
+        selector=f"xpath={xpath}", description="NEWS", method="click", arguments=[]
+    )
+
+
+async def compile_step(manifest, device, xpath):
+    manifest.begin_step(STEP, device)
+    manifest.record(await manifest.compile(FakePage(), click_action(xpath)))
+
+
+async def test_locators_are_kept_per_device(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    compiling = LocatorManifest(path, mode=COMPILE_MODE)
+    await compile_step(compiling, "desktop", "/desktop-news")
+    await compile_step(compiling, "mobile", "/mobile-news")
+    compiling.save()
+
+    replaying = LocatorManifest(path, mode=FAST_MODE)
+    page = FakePage()
+    for device in ("desktop", "mobile"):
+        replaying.begin_step(STEP, device)
+        assert await replaying.replay(page) is not None
+
+    assert page.clicked == ['a[href="/desktop-news"]', 'a[href="/mobile-news"]']
+
+
+async def test_fast_mode_replaces_and_saves_a_stale_locator(tmp_path):
+    path = tmp_path / "manifest.json"
+    compiling = LocatorManifest(str(path), mode=COMPILE_MODE)
+    await compile_step(compiling, "desktop", "/old-news")
+    compiling.save()
+
+    replaying = LocatorManifest(str(path), mode=FAST_MODE)
+    replaying.begin_step(STEP, "desktop")
+    page = FakePage(missing={'a[href="/old-news"]'})
+    assert await replaying.replay(page) is None
+    # What act() resolved instead becomes the step's locator
+    replaying.record(await replaying.compile(page, click_action("/news")))
+    replaying.save()
+
+    entries = json.loads(path.read_text())
+    assert entries == {
+        f"desktop|{STEP}": [
+            {"method": "click", "locator": 'a[href="/news"]', "arguments": []}
+        ]
+    }
+
+
+async def test_fast_mode_without_a_miss_writes_nothing(tmp_path):
+    path = tmp_path / "manifest.json"
+    compiling = LocatorManifest(str(path), mode=COMPILE_MODE)
+    await compile_step(compiling, "desktop", "/news")
+    compiling.save()
+    saved = path.read_text()
+
+    replaying = LocatorManifest(str(path), mode=FAST_MODE)
+    replaying.begin_step(STEP, "desktop")
+    assert await replaying.replay(FakePage()) is not None
+    assert await replaying.compile(FakePage(), click_action("/other")) is None
+    path.write_text(saved.replace("/news", "/written-by-another-worker"))
+    replaying.save()
+
+    assert "/written-by-another-worker" in path.read_text()
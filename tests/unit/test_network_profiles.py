@@ -0,0 +1,113 @@
+import pytest
+
+from utils.network_profiles import (
+    NETWORK_PROFILES,
+    PLACEHOLDER_PNG,
+    NetworkProfile,
+    get_network_profile,
+)
+
+SITE_URL = "https://www.transglobalus.com/about-us/"
+TRACKER_URL = "https://www.google-analytics.com/g/collect"
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def fallback(self):
+        self.outcome = ("fallback",)
+
+    async def fulfill(self, status, content_type, body):
+        self.outcome = ("fulfill", content_type, body)
+
+    async def abort(self, error_code):
+        self.outcome = ("abort", error_code)
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+def test_full_profile_blocks_nothing():
+    profile = get_network_profile("full")
+
+    assert not profile.blocks_anything
+    assert not profile.should_block("image", SITE_URL)
+    assert not profile.should_block("script", TRACKER_URL)
+
+
+def test_lean_profile_blocks_trackers_and_media_only():
+    profile = get_network_profile("lean")
+
+    assert profile.should_block("script", TRACKER_URL)
+    assert profile.should_block("media", SITE_URL)
+    assert not profile.should_block("image", SITE_URL)
+    assert not profile.should_block("document", SITE_URL)
+
+
+def test_assertions_only_profile_blocks_static_assets():
+    profile = get_network_profile("assertions-only")
+
+    for resource_type in ("image", "media", "font"):
+        assert profile.should_block(resource_type, SITE_URL)
+    assert not profile.should_block("stylesheet", SITE_URL)
+
+
+def test_domains_match_subdomains_but_not_lookalikes():
+    profile = NetworkProfile(name="test", blocked_domains=("doubleclick.net",))
+
+    assert profile.should_block("script", "https://doubleclick.net/ad.js")
+    assert profile.should_block("script", "https://stats.g.doubleclick.net/ad.js")
+    assert not profile.should_block("script", "https://notdoubleclick.net/ad.js")
+
+
+def test_allowed_domains_block_everything_else():
+    profile = NetworkProfile(name="test", allowed_domains=("transglobalus.com",))
+
+    assert not profile.should_block("document", SITE_URL)
+    assert profile.should_block("script", "https://cdn.example.com/lib.js")
+    # URLs without a host (data:, about:blank) are never blocked by domain
+    assert not profile.should_block("image", "data:image/png;base64,AAAA")
+
+
+def test_get_network_profile_rejects_unknown_name():
+    with pytest.raises(ValueError, match="Unsupported network profile"):
+        get_network_profile("offline")
+    assert set(NETWORK_PROFILES) == {"full", "lean", "assertions-only"}
+
+
+async def test_attach_routes_only_when_something_is_blocked():
+    full_context = FakeContext()
+    lean_context = FakeContext()
+
+    await get_network_profile("full").attach(full_context)
+    await get_network_profile("lean").attach(lean_context)
+
+    assert full_context.routes == []
+    assert lean_context.routes == ["**/*"]
+
+
+async def test_blocked_images_get_a_placeholder_and_others_abort():
+    profile = get_network_profile("assertions-only")
+    image = FakeRoute("image", SITE_URL)
+    font = FakeRoute("font", SITE_URL)
+    page = FakeRoute("document", SITE_URL)
+
+    for route in (image, font, page):
+        await profile._handle_route(route)
+
+    assert image.outcome == ("fulfill", "image/png", PLACEHOLDER_PNG)
+    assert font.outcome == ("abort", "blockedbyclient")
+    assert page.outcome == ("fallback",)
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from tests.pages.base.readiness import (
+    READINESS_POLICIES,
+    LoadStateReadiness,
+    NetworkIdleReadiness,
+    ReadinessPolicy,
+    get_readiness_policy,
+)
+
+IDLE_MS = 50
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakePage:
+    """
+    Page stand-in that lets a test fire request events at the registered listeners;
+    ``loading_requests`` are issued while a load state is awaited.
+    """
+
+    def __init__(self, loading_requests=()):
+        self.listeners = {}
+        self.load_states = []
+        self.loading_requests = loading_requests
+
+    async def wait_for_load_state(self, state, timeout=None):
+        self.load_states.append(state)
+        for request in self.loading_requests:
+            self.emit("request", request)
+
+    def on(self, event, listener):
+        self.listeners[event] = listener
+
+    def remove_listener(self, event, listener):
+        del self.listeners[event]
+
+    def emit(self, event, request):
+        self.listeners[event](request)
+
+
+def test_get_readiness_policy_returns_registered_policy():
+    for name, policy in READINESS_POLICIES.items():
+        assert get_readiness_policy(name) is policy
+
+
+def test_get_readiness_policy_rejects_unknown_name():
+    with pytest.raises(ValueError, match="Unsupported readiness policy"):
+        get_readiness_policy("instant")
+
+
+def test_readiness_policy_requires_wait():
+    with pytest.raises(TypeError):
+        ReadinessPolicy()
+
+
+async def test_load_state_readiness_waits_for_its_state():
+    page = FakePage()
+
+    await LoadStateReadiness("load").wait(page, 1000)
+
+    assert page.load_states == ["load"]
+
+
+async def test_network_idle_waits_for_tracked_request():
+    page = FakePage()
+    policy = NetworkIdleReadiness(idle_ms=IDLE_MS)
+    script = FakeRequest("https://www.transglobalus.com/app.js")
+
+    async def finish_later():
+        await asyncio.sleep(0)
+        page.emit("request", script)
+        await asyncio.sleep(3 * IDLE_MS / 1000)
+        page.emit("requestfinished", script)
+
+    started = asyncio.get_running_loop().time()
+    traffic = asyncio.create_task(finish_later())
+    await policy.wait(page, 2000)
+    await traffic
+
+    assert asyncio.get_running_loop().time() - started >= 3 * IDLE_MS / 1000
+    assert page.listeners == {}
+
+
+async def test_network_idle_tracks_requests_issued_before_domcontentloaded():
+    script = FakeRequest("https://www.transglobalus.com/app.js")
+    page = FakePage(loading_requests=[script])
+    policy = NetworkIdleReadiness(idle_ms=IDLE_MS)
+
+    async def finish_later():
+        await asyncio.sleep(3 * IDLE_MS / 1000)
+        page.emit("requestfinished", script)
+
+    started = asyncio.get_running_loop().time()
+    traffic = asyncio.create_task(finish_later())
+    await policy.wait(page, 2000)
+    await traffic
+
+    assert asyncio.get_running_loop().time() - started >= 3 * IDLE_MS / 1000
+
+
+async def test_network_idle_ignores_matching_requests():
+    page = FakePage()
+    policy = NetworkIdleReadiness(idle_ms=IDLE_MS)
+
+    async def analytics():
+        await asyncio.sleep(0)
+        page.emit("request", FakeRequest("https://www.google-analytics.com/collect"))
+
+    traffic = asyncio.create_task(analytics())
+    await policy.wait(page, 500)
+    await traffic
+
+
+async def test_network_idle_times_out_with_pending_urls():
+    page = FakePage()
+    policy = NetworkIdleReadiness(ignored_url_patterns=[], idle_ms=IDLE_MS)
+
+    async def stuck():
+        await asyncio.sleep(0)
+        page.emit("request", FakeRequest("https://www.transglobalus.com/poll"))
+
+    traffic = asyncio.create_task(stuck())
+    with pytest.raises(PlaywrightTimeoutError, match="transglobalus.com/poll"):
+        await policy.wait(page, 200)
+    await traffic
+    assert page.listeners == {}
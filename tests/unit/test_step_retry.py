@@ -0,0 +1,68 @@
+import pytest
+
+FEATURE = """\
+Feature: Step retries
+  Scenario: Flaky step within the budget
+    Then the check should pass on attempt 2
+
+  Scenario: Flaky step beyond the budget
+    Then the check should pass on attempt 3
+"""
+
+STEPS = """\
+from pytest_bdd import parsers, scenarios, then
+
+from tests.pages.base.step_retry import retryable_step
+
+scenarios("step_retry.feature")
+
+ATTEMPTS = {}
+
+
+@then(parsers.parse("the check should pass on attempt {passing:d}"))
+@retryable_step(attempts=3, delay=0)
+async def check_passes_on_attempt(passing):
+    ATTEMPTS[passing] = ATTEMPTS.get(passing, 0) + 1
+    print(f"attempt {ATTEMPTS[passing]} of the step passing on {passing}")
+    assert ATTEMPTS[passing] >= passing
+"""
+
+# One in-place retry per scenario, as --step-retries=1 would give
+CONFTEST = """\
+from tests.pages.base.step_retry import STEP_RETRY_BUDGET
+
+pytest_plugins = ["tests.pages.base.async_steps"]
+
+
+def pytest_bdd_before_scenario(request, feature, scenario):
+    STEP_RETRY_BUDGET.reset(1, delay=0)
+"""
+
+
+@pytest.fixture
+def bdd_project(pytester):
+    pytester.makeini("""
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = session
+        asyncio_default_test_loop_scope = session
+        """)
+    pytester.makeconftest(CONFTEST)
+    pytester.makefile(".feature", step_retry=FEATURE)
+    pytester.makepyfile(test_step_retry=STEPS)
+    return pytester
+
+
+def test_flaky_then_step_is_retried_within_its_budget(bdd_project):
+    result = bdd_project.runpytest("-p", "no:cacheprovider", "-s")
+
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*attempt 1 of the step passing on 2*",
+            "*retrying it (1/2)*",
+            "*attempt 2 of the step passing on 2*",
+        ]
+    )
+    # The second scenario spends its single retry and fails on the next attempt
+    result.stdout.no_fnmatch_line("*attempt 3 of the step passing on 3*")
@@ -0,0 +1,298 @@
+"""
+Persistent cache for Stagehand ``page.act()`` instruction resolution.
+
+A cache miss resolves the instruction with ``page.observe()`` (one model call) and runs the
+returned action through ``page.act(observe_result)``. The resolved action is stored on disk,
+keyed by instruction text, model name and a fingerprint of the page's interactive elements,
+so the next run replays it without calling the model. Entries whose replay fails are dropped
+and resolved again. A ``LocatorManifest`` can sit in front of the cache to replay compiled
+static locators before any Stagehand call is made.
+
+``act_sequence()`` resolves several instructions that run back to back (hover a menu,
+then click one of its items) with a single ``page.observe()`` call and caches the whole
+plan. Steps of a plan that cannot be resolved or executed fall back to one model call each.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from playwright.async_api import Page
+from stagehand.schemas import ActResult, ObserveResult
+
+from utils.json_file import write_json_atomic
+from utils.locator_manifest import COMPILE_MODE, FAST_MODE, LocatorManifest
+from utils.timing import ACT, MODEL, TIMINGS
+
+# Structural fingerprint: stable across ads/timestamps, changes when the menus change
+FINGERPRINT_SCRIPT = """
+() => {
+    const elements = document.querySelectorAll(
+        "a, button, input, select, textarea, [role]"
+    );
+    const parts = [location.origin + location.pathname];
+    for (const element of elements) {
+        const text = (element.innerText || element.value || "").trim().slice(0, 40);
+        const href = element.getAttribute("href") || "";
+        const role = element.getAttribute("role") || "";
+        parts.push(`${element.tagName}|${role}|${text}|${href}`);
+    }
+    return parts.join("\\n");
+}
+"""
+
+# Asks for every action of a sequence at once; hidden targets (dropdown items) are
+# usually still present in the accessibility tree before the hover that reveals them
+PLAN_INSTRUCTION = (
+    "Find the element for each of these actions, which will be performed in this "
+    "order:\n{steps}\nReturn exactly one element per action, in the same order, with "
+    "the method and arguments that perform it. An element may only become visible "
+    "after an earlier action, such as a hover, has been performed."
+)
+UNSUPPORTED_METHOD = "not-supported"
+
+T = TypeVar("T")
+
+
+class ActCache:
+    """
+    On-disk cache of resolved ``act()`` instructions.
+
+    Args:
+        cache_dir: Directory holding one JSON file per cached instruction
+        model_name: Stagehand model name; part of the cache key
+        enabled: When False every call goes straight to ``page.act()``
+        manifest: Locator manifest consulted before, and compiled alongside, the cache
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        model_name: str,
+        enabled: bool = True,
+        manifest: Optional[LocatorManifest] = None,
+    ):
+        self.cache_dir = os.path.join(cache_dir, "act")
+        self.model_name = model_name
+        self.enabled = enabled
+        self.manifest = manifest or LocatorManifest()
+        if enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    async def act(self, page: Page, instruction: str) -> ActResult:
+        """
+        Run a natural language action, replaying the cached resolution when possible.
+
+        Args:
+            page: Stagehand page to act on
+            instruction: Natural language action, e.g. 'click the "NEWS" in the header'
+
+        Returns:
+            Stagehand ActResult of the executed action
+        """
+        with TIMINGS.measure(ACT, instruction):
+            return await self._act(page, instruction)
+
+    async def act_sequence(
+        self, page: Page, instructions: List[str]
+    ) -> List[ActResult]:
+        """
+        Run natural language actions in order, resolving all of them with one model call.
+
+        Each resolved action is executed and checked before the next one runs; from the
+        first step that fails, the remaining steps are resolved one at a time.
+
+        Args:
+            page: Stagehand page to act on
+            instructions: Actions in execution order, e.g. a hover followed by a click
+
+        Returns:
+            Stagehand ActResult of every executed action
+        """
+        with TIMINGS.measure(ACT, " -> ".join(instructions)):
+            return await self._act_sequence(page, instructions)
+
+    async def _act(self, page: Page, instruction: str) -> ActResult:
+        if self.manifest.mode == FAST_MODE:
+            result = await self.manifest.replay(page)
+            if result is not None:
+                return result
+        return await self._resolve(page, instruction)
+
+    async def _act_sequence(
+        self, page: Page, instructions: List[str]
+    ) -> List[ActResult]:
+        if self.manifest.mode == FAST_MODE:
+            results = await self._replay_sequence(page, instructions)
+            if results:
+                return results
+        if len(instructions) == 1:
+            return [await self._resolve(page, instructions[0])]
+
+        key = await self._build_key(page, "\n".join(instructions))
+        actions, cached = await self._plan_sequence(page, key, instructions)
+        results = await self._run_plan(page, actions)
+        if actions and len(results) == len(instructions):
+            if not cached and self.enabled:
+                self._store_sequence(key, actions)
+            return results
+        if actions and cached:
+            self._evict(key)
+        elif actions and self.enabled:
+            # Like an invalid plan, a failing one is not observed again for this sequence
+            self._store_sequence(key, [])
+        return await self._resolve_remaining(page, instructions, results)
+
+    async def _replay_sequence(
+        self, page: Page, instructions: List[str]
+    ) -> List[ActResult]:
+        """
+        Replay compiled manifest entries for the leading steps, or return an empty list
+        when the manifest has nothing for the first one.
+        """
+        results: List[ActResult] = []
+        for _ in instructions:
+            result = await self.manifest.replay(page)
+            if result is None:
+                break
+            results.append(result)
+        if not results:
+            return results
+        return await self._resolve_remaining(page, instructions, results)
+
+    async def _plan_sequence(
+        self, page: Page, key: str, instructions: List[str]
+    ) -> Tuple[List[ObserveResult], bool]:
+        """
+        Cached or freshly observed actions of the sequence, and whether they came from
+        the cache. An empty list means the sequence has to be resolved step by step.
+        """
+        if self.enabled:
+            actions = self._load_sequence(key)
+            if actions is not None:
+                return actions, True
+
+        plan = PLAN_INSTRUCTION.format(
+            steps="\n".join(
+                f"{position}. {instruction}"
+                for position, instruction in enumerate(instructions, 1)
+            )
+        )
+        with TIMINGS.measure(MODEL, " -> ".join(instructions)):
+            observations = await page.observe(plan)
+        actions = self._validate_plan(observations, len(instructions))
+        if not actions and self.enabled:
+            # Remember that this sequence has to be resolved step by step
+            self._store_sequence(key, [])
+        return actions, False
+
+    async def _run_plan(
+        self, page: Page, actions: List[ObserveResult]
+    ) -> List[ActResult]:
+        results: List[ActResult] = []
+        for action in actions:
+            result = await self._run(page, action)
+            if not result.success:
+                break
+            results.append(result)
+        return results
+
+    async def _resolve_remaining(
+        self, page: Page, instructions: List[str], results: List[ActResult]
+    ) -> List[ActResult]:
+        resolved = len(results)
+        for instruction in instructions[resolved:]:
+            results.append(await self._resolve(page, instruction))
+        return results
+
+    async def _resolve(self, page: Page, instruction: str) -> ActResult:
+        if not self.enabled and self.manifest.mode != COMPILE_MODE:
+            with TIMINGS.measure(MODEL, instruction):
+                return await page.act(instruction)
+
+        key = await self._build_key(page, instruction)
+        cached_action = self._load(key) if self.enabled else None
+        if cached_action is not None:
+            result = await self._run(page, cached_action)
+            if result.success:
+                return result
+            self._evict(key)
+
+        with TIMINGS.measure(MODEL, instruction):
+            observations = await page.observe(instruction)
+            if not observations:
+                return await page.act(instruction)
+        result = await self._run(page, observations[0])
+        if result.success and self.enabled:
+            self._store(key, observations[0])
+        return result
+
+    async def _build_key(self, page: Page, instruction: str) -> str:
+        fingerprint = await page.evaluate(FINGERPRINT_SCRIPT)
+        raw_key = "\n".join([self.model_name, instruction, fingerprint])
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    async def _run(self, page: Page, action: ObserveResult) -> ActResult:
+        compiled_entry = await self.manifest.compile(page, action)
+        try:
+            result = await page.act(action)
+        except Exception as e:
+            return ActResult(success=False, message=str(e), action=action.description)
+        if result.success:
+            self.manifest.record(compiled_entry)
+        return result
+
+    @staticmethod
+    def _validate_plan(
+        observations: List[ObserveResult], steps: int
+    ) -> List[ObserveResult]:
+        """
+        Actions of a resolved plan, or an empty list when it is not one usable action
+        per step.
+        """
+        actions = observations[:steps]
+        if len(actions) < steps or any(
+            not action.method or action.method == UNSUPPORTED_METHOD
+            for action in actions
+        ):
+            return []
+        return actions
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[ObserveResult]:
+        return self._read_entry(key, lambda data: ObserveResult(**data))
+
+    def _store(self, key: str, action: ObserveResult):
+        self._write_entry(key, self._serialize(action))
+
+    def _load_sequence(self, key: str) -> Optional[List[ObserveResult]]:
+        return self._read_entry(
+            key, lambda data: [ObserveResult(**action) for action in data]
+        )
+
+    def _store_sequence(self, key: str, actions: List[ObserveResult]):
+        self._write_entry(key, [self._serialize(action) for action in actions])
+
+    @staticmethod
+    def _serialize(action: ObserveResult) -> dict:
+        # The backend node id only identifies the element within one page load
+        return action.model_dump(exclude_none=True, exclude={"backend_node_id"})
+
+    def _read_entry(self, key: str, decode: Callable[[Any], T]) -> Optional[T]:
+        try:
+            with open(self._path(key), encoding="utf-8") as cache_file:
+                return decode(json.load(cache_file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_entry(self, key: str, entry: Any):
+        write_json_atomic(self._path(key), entry)
+
+    def _evict(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
@@ -0,0 +1,223 @@
+"""
+Failure-only debugging artifacts.
+
+Every scenario keeps its last few steps in a ring buffer; with tracing opted in
+(``--artifacts=trace``) it also records a Playwright trace chunk. A passing scenario
+discards both without writing anything. A failing one flushes
+``<artifacts_dir>/run-<timestamp>-<pid>/<scenario>/`` with a screenshot, the DOM, the step
+log and the trace, in that order, until the run's size cap is reached. Only those run
+directories are ever deleted, oldest first, once more than a few runs have flushed.
+"""
+
+import json
+import os
+import re
+import shutil
+import time
+import weakref
+from collections import deque
+from typing import Deque, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+NO_ARTIFACTS = "off"
+FAILURE_ARTIFACTS = "failure"
+TRACE_ARTIFACTS = "trace"
+ARTIFACT_MODES = [NO_ARTIFACTS, FAILURE_ARTIFACTS, TRACE_ARTIFACTS]
+
+DEFAULT_ARTIFACTS_MAX_MB = 200
+DEFAULT_ARTIFACT_STEPS = 10
+DEFAULT_ARTIFACT_RUNS_KEPT = 5
+
+RUN_DIR_PATTERN = re.compile(r"^run-\d{8}-\d{6}-\d+$")
+
+# Contexts already tracing; shared contexts outlive a scenario and only start once
+_tracing_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+def new_run_dir(root_dir: str) -> str:
+    """
+    Directory the artifacts of a new run go to; created on its first flush.
+    """
+    return os.path.join(root_dir, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+
+
+def prune_run_dirs(root_dir: str, keep: int = DEFAULT_ARTIFACT_RUNS_KEPT):
+    """
+    Delete all but the ``keep`` newest run directories; nothing else in ``root_dir``.
+    """
+    try:
+        run_names = sorted(
+            name for name in os.listdir(root_dir) if RUN_DIR_PATTERN.match(name)
+        )
+    except OSError:
+        return
+    for run_name in run_names[: max(len(run_names) - keep, 0)]:
+        shutil.rmtree(os.path.join(root_dir, run_name), ignore_errors=True)
+
+
+class ArtifactBudget:
+    """
+    Size cap of everything flushed into the run directory.
+
+    The directory is measured on every check, so all xdist workers share the cap.
+
+    Args:
+        root_dir: Artifacts directory of the run (see ``new_run_dir``)
+        max_bytes: Total size allowed
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+
+    def remaining(self) -> int:
+        used = 0
+        for dir_path, _, file_names in os.walk(self.root_dir):
+            for file_name in file_names:
+                try:
+                    used += os.path.getsize(os.path.join(dir_path, file_name))
+                except OSError:
+                    pass
+        return self.max_bytes - used
+
+
+class ScenarioArtifacts:
+    """
+    Trace chunk and recent steps of one scenario, written out only if it fails.
+
+    Args:
+        context: Browser context of the scenario
+        page: Page the scenario drives
+        scenario_id: Pytest node id, used as the artifact directory name
+        budget: Size cap shared by the run
+        trace: Record a Playwright trace (snapshots and screenshots) of the scenario
+        history_size: Number of most recent steps kept for the step log
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        page: Page,
+        scenario_id: str,
+        budget: ArtifactBudget,
+        trace: bool = False,
+        history_size: int = DEFAULT_ARTIFACT_STEPS,
+    ):
+        self.context = context
+        self.page = page
+        self.scenario_id = scenario_id
+        self.budget = budget
+        self.trace = trace
+        self.steps: Deque[dict] = deque(maxlen=history_size)
+        self._tracing = False
+
+    @property
+    def directory(self) -> str:
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.scenario_id).strip("_")
+        return os.path.join(self.budget.root_dir, name)
+
+    async def start(self):
+        if not self.trace:
+            return
+        try:
+            if self.context in _tracing_contexts:
+                await self.context.tracing.start_chunk(title=self.scenario_id)
+            else:
+                await self.context.tracing.start(
+                    title=self.scenario_id, screenshots=True, snapshots=True
+                )
+                _tracing_contexts.add(self.context)
+            self._tracing = True
+        except Exception as e:
+            print(f"⚠️ Could not start tracing {self.scenario_id}: {e}")
+
+    def record_step(self, step_name: str, passed: bool, seconds: Optional[float]):
+        self.steps.append(
+            {
+                "step": step_name,
+                "passed": passed,
+                "seconds": round(seconds, 3) if seconds is not None else None,
+                "url": self._page_url(),
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
+
+    async def finish(self, failed: bool):
+        """
+        Discard the trace of a passing scenario, or flush every artifact of a failed one.
+        """
+        if not failed:
+            if self._tracing:
+                await self._stop_trace(None)
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        saved = [
+            await self._save_screenshot(),
+            await self._save_dom(),
+            self._save_steps(),
+            await self._save_trace(),
+        ]
+        written = [file_name for file_name in saved if file_name is not None]
+        if written:
+            print(f"Failure artifacts in {self.directory}: {', '.join(written)}")
+            return
+        print(f"⚠️ Artifact size cap reached, nothing saved for {self.scenario_id}")
+        if not os.listdir(self.directory):
+            os.rmdir(self.directory)
+
+    async def _save_screenshot(self) -> Optional[str]:
+        try:
+            screenshot = await self.page.screenshot(full_page=True)
+        except Exception as e:
+            print(f"⚠️ Could not take failure screenshot: {e}")
+            return None
+        return self._write("screenshot.png", screenshot)
+
+    async def _save_dom(self) -> Optional[str]:
+        try:
+            dom = await self.page.content()
+        except Exception as e:
+            print(f"⚠️ Could not capture failure DOM: {e}")
+            return None
+        return self._write("dom.html", dom.encode("utf-8"))
+
+    def _save_steps(self) -> Optional[str]:
+        steps = json.dumps(list(self.steps), indent=2)
+        return self._write("steps.json", steps.encode("utf-8"))
+
+    async def _save_trace(self) -> Optional[str]:
+        if not self._tracing:
+            return None
+        if self.budget.remaining() <= 0:
+            await self._stop_trace(None)
+            return None
+        trace_path = os.path.join(self.directory, "trace.zip")
+        await self._stop_trace(trace_path)
+        if not os.path.exists(trace_path):
+            return None
+        if self.budget.remaining() < 0:
+            os.remove(trace_path)
+            return None
+        return "trace.zip"
+
+    def _write(self, file_name: str, content: bytes) -> Optional[str]:
+        if len(content) > self.budget.remaining():
+            return None
+        with open(os.path.join(self.directory, file_name), "wb") as artifact_file:
+            artifact_file.write(content)
+        return file_name
+
+    async def _stop_trace(self, path: Optional[str]):
+        self._tracing = False
+        try:
+            await self.context.tracing.stop_chunk(path=path)
+        except Exception as e:
+            print(f"⚠️ Could not stop tracing {self.scenario_id}: {e}")
+
+    def _page_url(self) -> Optional[str]:
+        try:
+            return self.page.url
+        except Exception:
+            return None
@@ -0,0 +1,314 @@
+"""
+Warm browser pool shared by every scenario that runs on one pytest(-xdist) worker.
+
+Each pool slot is a Chromium process with a Stagehand instance attached to it over CDP.
+Scenarios lease a slot and get a brand-new browser context and page, so isolation
+comes from resetting the context instead of relaunching the browser process. Read-only
+scenarios can opt into a shared lease instead, which keeps one context and page per slot
+open across scenarios so they can skip navigating to a page that is already loaded.
+
+After every lease the pool samples the browser's memory (its whole process group) and
+relaunches it once it crosses the configured RSS ceiling or has served enough scenarios.
+"""
+
+import asyncio
+import json
+import shutil
+import subprocess
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Set, Union
+
+from playwright.async_api import Browser, BrowserContext, async_playwright
+from stagehand import Stagehand, StagehandConfig
+from stagehand.browser import apply_stealth_scripts
+from stagehand.context import StagehandContext
+
+from utils.network_profiles import NetworkProfile
+from utils.resource_allocator import (
+    AUTO_DEBUG_PORT,
+    allocate_profile_dir,
+    kill_process_group,
+    process_group_rss,
+    track_browser,
+    untrack_browser,
+)
+from utils.timing import BROWSER_STARTUP, TIMINGS
+
+DEVTOOLS_LISTENING_PREFIX = "DevTools listening on "
+BROWSER_START_TIMEOUT = 30
+BROWSER_EXIT_TIMEOUT = 5
+DEFAULT_BROWSER_MAX_RSS_MB = 2048
+
+
+@dataclass
+class PooledBrowser:
+    """A running Chromium process and the Stagehand instance connected to it."""
+
+    process: asyncio.subprocess.Process
+    stagehand: Stagehand
+    browser: Browser
+    user_data_dir: str
+    stderr_task: asyncio.Task
+    slot: int
+    leases: int = 0
+    shared_contexts: Dict[str, StagehandContext] = field(default_factory=dict)
+
+
+class BrowserPool:
+    """
+    Keeps ``size`` warm Stagehand/Chromium pairs and hands them out one scenario at a time.
+
+    Args:
+        config: Stagehand configuration; the CDP endpoint is filled in per browser
+        chromium_args: Extra command line switches passed to every Chromium process
+        size: Number of browsers kept warm for this worker
+        max_rss_mb: Relaunch a browser whose RSS exceeds this after a scenario (0: never)
+        max_leases: Relaunch a browser after this many scenarios (0: never)
+    """
+
+    def __init__(
+        self,
+        config: StagehandConfig,
+        chromium_args: List[str],
+        size: int = 1,
+        max_rss_mb: int = 0,
+        max_leases: int = 0,
+    ):
+        self.config = config
+        self.chromium_args = chromium_args
+        self.size = size
+        self.max_rss_mb = max_rss_mb
+        self.max_leases = max_leases
+        self.peak_rss_mb = 0.0
+        self.recycled = 0
+        self._browsers: List[PooledBrowser] = []
+        self._idle: "asyncio.Queue[PooledBrowser]" = asyncio.Queue()
+        self._executable_path: Optional[str] = None
+        # Scenario contexts still closing in the background
+        self._closing: Set[asyncio.Task] = set()
+
+    async def start(self):
+        for slot in range(self.size):
+            with TIMINGS.measure(BROWSER_STARTUP, "launch"):
+                pooled_browser = await self._launch(slot)
+            self._browsers.append(pooled_browser)
+            self._idle.put_nowait(pooled_browser)
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        context_options: dict,
+        network_profile: Optional[NetworkProfile] = None,
+        shared: bool = False,
+    ) -> AsyncIterator[Stagehand]:
+        """
+        Borrow a warm browser with a fresh context and page for the duration of a scenario.
+
+        Args:
+            context_options: Keyword arguments for ``Browser.new_context`` (viewport, etc.)
+            network_profile: Request blocking applied to the context before the page opens
+            shared: Reuse the slot's shared context and page, keeping whatever it last
+                navigated to, instead of opening a new one; it stays open after the lease
+
+        Yields:
+            Stagehand instance whose ``page`` points at the leased page
+        """
+        if not self._browsers:
+            raise RuntimeError("Browser pool has no browsers left")
+        pooled_browser = await self._idle.get()
+        stagehand = pooled_browser.stagehand
+        context = None
+        try:
+            shared_key = self._shared_key(context_options, network_profile)
+            shared_context = pooled_browser.shared_contexts.get(shared_key)
+            if shared and self._is_open(shared_context):
+                await self._reuse_context(stagehand, shared_context)
+            else:
+                with TIMINGS.measure(BROWSER_STARTUP, "new_context"):
+                    context = await pooled_browser.browser.new_context(
+                        **context_options
+                    )
+                    await apply_stealth_scripts(context, stagehand.logger)
+                    if network_profile is not None:
+                        await network_profile.attach(context)
+                    stagehand.context = await StagehandContext.init(context, stagehand)
+                    await stagehand.context.new_page()
+                if shared:
+                    if shared_context is not None:
+                        # Its page was closed by the previous scenario
+                        await self._close_context(shared_context)
+                    pooled_browser.shared_contexts[shared_key] = stagehand.context
+                    context = None
+            yield stagehand
+        finally:
+            if context is not None:
+                # Stop the closing pages from re-pointing Stagehand's active page, which
+                # the next lease of this browser may already have set
+                stagehand.context.active_stagehand_page = None
+            await self._release(pooled_browser, context)
+
+    async def close(self):
+        await asyncio.gather(*self._closing)
+        await asyncio.gather(
+            *(self._close_browser(pooled_browser) for pooled_browser in self._browsers)
+        )
+        self._browsers.clear()
+
+    def memory_stats(self) -> dict:
+        return {"peak_rss_mb": round(self.peak_rss_mb, 1), "recycled": self.recycled}
+
+    async def _release(
+        self, pooled_browser: PooledBrowser, context: Optional[BrowserContext]
+    ):
+        pooled_browser.leases += 1
+        rss_mb = (
+            await asyncio.to_thread(process_group_rss, pooled_browser.process.pid)
+            / 1024
+            / 1024
+        )
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        if self.max_rss_mb and rss_mb > self.max_rss_mb:
+            reason = f"RSS {rss_mb:.0f} MB over {self.max_rss_mb} MB"
+        elif self.max_leases and pooled_browser.leases >= self.max_leases:
+            reason = f"served {pooled_browser.leases} scenarios"
+        else:
+            if context is not None:
+                self._close_in_background(context)
+            self._idle.put_nowait(pooled_browser)
+            return
+
+        print(f"Recycling browser {pooled_browser.slot} ({reason})")
+        self._browsers.remove(pooled_browser)
+        if context is not None:
+            # Closing the context writes its HAR recording, if any
+            await self._close_context(context)
+        await self._close_browser(pooled_browser)
+        with TIMINGS.measure(BROWSER_STARTUP, "recycle"):
+            replacement = await self._launch(pooled_browser.slot)
+        self.recycled += 1
+        self._browsers.append(replacement)
+        self._idle.put_nowait(replacement)
+
+    def _close_in_background(self, context: BrowserContext):
+        """Close a scenario's context without making the scenario's teardown wait."""
+        task = asyncio.create_task(self._close_context(context))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_browser(self, pooled_browser: PooledBrowser):
+        for shared_context in pooled_browser.shared_contexts.values():
+            await self._close_context(shared_context)
+        pooled_browser.shared_contexts.clear()
+        try:
+            await pooled_browser.stagehand.close()
+        except Exception as e:
+            print(f"Error closing Stagehand: {e}")
+        await self._terminate(pooled_browser.process)
+        pooled_browser.stderr_task.cancel()
+        await asyncio.to_thread(
+            shutil.rmtree, pooled_browser.user_data_dir, ignore_errors=True
+        )
+
+    async def _launch(self, slot: int) -> PooledBrowser:
+        user_data_dir = allocate_profile_dir(slot)
+        process = await asyncio.create_subprocess_exec(
+            await self._get_executable_path(),
+            f"--remote-debugging-port={AUTO_DEBUG_PORT}",
+            f"--user-data-dir={user_data_dir}",
+            *self.chromium_args,
+            "about:blank",
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            # Own process group, so the reaper can kill the browser with its children
+            start_new_session=True,
+        )
+        track_browser(process.pid, user_data_dir)
+        try:
+            ws_endpoint = await asyncio.wait_for(
+                self._read_ws_endpoint(process), timeout=BROWSER_START_TIMEOUT
+            )
+            # Chromium blocks once its stderr pipe is full, so keep draining it
+            stderr_task = asyncio.create_task(self._drain(process.stderr))
+            stagehand = Stagehand(
+                self.config.with_overrides(
+                    local_browser_launch_options={"cdp_url": ws_endpoint}
+                )
+            )
+            await stagehand.init()
+        except Exception:
+            await self._terminate(process)
+            await asyncio.to_thread(shutil.rmtree, user_data_dir, ignore_errors=True)
+            raise
+        return PooledBrowser(
+            process=process,
+            stagehand=stagehand,
+            browser=stagehand.context.browser,
+            user_data_dir=user_data_dir,
+            stderr_task=stderr_task,
+            slot=slot,
+        )
+
+    @staticmethod
+    async def _close_context(context: Union[BrowserContext, StagehandContext]):
+        try:
+            await context.close()
+        except Exception as e:
+            print(f"Error closing browser context: {e}")
+
+    @staticmethod
+    def _shared_key(
+        context_options: dict, network_profile: Optional[NetworkProfile]
+    ) -> str:
+        profile_name = network_profile.name if network_profile is not None else ""
+        return f"{profile_name}:{json.dumps(context_options, sort_keys=True)}"
+
+    @staticmethod
+    def _is_open(shared_context: Optional[StagehandContext]) -> bool:
+        if shared_context is None:
+            return False
+        active_page = shared_context.get_active_page()
+        return active_page is not None and not active_page.is_closed()
+
+    @staticmethod
+    async def _reuse_context(stagehand: Stagehand, shared_context: StagehandContext):
+        active_page = shared_context.get_active_page()
+        stagehand.context = shared_context
+        shared_context.set_active_page(active_page)
+        # Drop hover state left behind by the previous scenario
+        await active_page.mouse.move(0, 0)
+
+    async def _get_executable_path(self) -> str:
+        if self._executable_path is None:
+            async with async_playwright() as playwright:
+                self._executable_path = playwright.chromium.executable_path
+        return self._executable_path
+
+    @staticmethod
+    async def _read_ws_endpoint(process: asyncio.subprocess.Process) -> str:
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                raise RuntimeError(
+                    f"Chromium exited before opening DevTools (code {process.returncode})"
+                )
+            text = line.decode(errors="replace").strip()
+            if text.startswith(DEVTOOLS_LISTENING_PREFIX):
+                return text.split(DEVTOOLS_LISTENING_PREFIX, 1)[1]
+
+    @staticmethod
+    async def _drain(stream: asyncio.StreamReader):
+        while await stream.readline():
+            pass
+
+    @staticmethod
+    async def _terminate(process: asyncio.subprocess.Process):
+        if process.returncode is None:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=BROWSER_EXIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        kill_process_group(process.pid)
+        untrack_browser(process.pid)
@@ -0,0 +1,200 @@
+"""
+Duration-aware pytest-xdist scheduling.
+
+Per-scenario durations are persisted between runs. The scheduler hands scenarios out
+longest-first (LPT) as workers free up, so the slow model-driven scenarios start early
+instead of piling onto one worker at the end of the run. Each worker prefers the longest
+pending scenario of the device it ran last, keeping its warm browser context options
+(and any shared page) reusable.
+"""
+
+import json
+import os
+import re
+from typing import Dict, Optional, Set
+
+import pytest
+from xdist.remote import Producer
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+from config.devices import DEVICE_TYPES
+from utils.json_file import write_json_atomic
+
+# Estimate for scenarios without history when nothing has been recorded yet
+DEFAULT_DURATION = 30.0
+# Weight of the newest measurement in the stored running average
+SMOOTHING = 0.5
+# One scenario running plus the next one, which the worker needs to know for teardown
+WORKER_QUEUE_DEPTH = 2
+
+PARAMS_PATTERN = re.compile(r"\[(.+)\]$")
+
+
+def device_of(nodeid: str) -> Optional[str]:
+    """
+    Device a test runs on, when its id carries a device parameter (``test_x[ipad]``).
+
+    Returns:
+        Device type, or None for tests that run on the session's single --device
+    """
+    match = PARAMS_PATTERN.search(nodeid)
+    if match is None:
+        return None
+    for param in match.group(1).split("-"):
+        if param in DEVICE_TYPES:
+            return param
+    return None
+
+
+class DurationStore:
+    """
+    Smoothed per-test wall times, keyed by node id and kept in a JSON file.
+
+    Args:
+        path: JSON file holding the durations of previous runs
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.durations: Dict[str, float] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as durations_file:
+                    self.durations = json.load(durations_file)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable durations file {path}: {e}")
+
+    def estimate(self, nodeid: str) -> float:
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return sum(self.durations.values()) / len(self.durations)
+        return DEFAULT_DURATION
+
+    def update(self, nodeid: str, seconds: float):
+        previous = self.durations.get(nodeid)
+        if previous is None:
+            self.durations[nodeid] = seconds
+        else:
+            self.durations[nodeid] = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+
+    def save(self):
+        write_json_atomic(self.path, self.durations, indent=2, sort_keys=True)
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    ``--dist=load`` variant that dispatches tests one at a time, longest first.
+
+    Args:
+        config: pytest config of the controlling process
+        durations: History used to estimate every collected test
+        log: xdist log producer
+    """
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        durations: DurationStore,
+        log: Optional[Producer] = None,
+    ):
+        super().__init__(config, log)
+        self.durations = durations
+        self._node_devices: Dict[WorkerController, Optional[str]] = {}
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = sorted(
+            range(len(self.collection)),
+            key=lambda index: -self.durations.estimate(self.collection[index]),
+        )
+        # Deal the longest tests round-robin so every worker starts on a long one
+        for _ in range(WORKER_QUEUE_DEPTH):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_next(node)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0):
+        if node.shutting_down:
+            return
+        if not self.pending:
+            node.shutdown()
+            return
+        while self.pending and len(self.node2pending[node]) < WORKER_QUEUE_DEPTH:
+            self._send_next(node)
+
+    def _send_next(self, node: WorkerController):
+        position = self._next_position(node)
+        index = self.pending.pop(position)
+        self._node_devices[node] = device_of(self.collection[index])
+        self.node2pending[node].append(index)
+        node.send_runtest_some([index])
+
+    def _next_position(self, node: WorkerController) -> int:
+        if node in self._node_devices:
+            device = self._node_devices[node]
+            for position, index in enumerate(self.pending):
+                if device_of(self.collection[index]) == device:
+                    return position
+        return 0
+
+
+class DurationPlugin:
+    """
+    pytest plugin for the controlling process: installs ``DurationScheduling`` for
+    ``-n`` runs and records every test's setup + call + teardown time for the next run.
+
+    Args:
+        durations: History to schedule from and to update
+        schedule: Replace xdist's ``--dist=load`` scheduler
+    """
+
+    def __init__(self, durations: DurationStore, schedule: bool = True):
+        self.durations = durations
+        self.schedule = schedule
+        self._seconds: Dict[str, float] = {}
+        self._skipped: Set[str] = set()
+        self._updated = False
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(
+        self, config: pytest.Config, log: Producer
+    ) -> Optional[DurationScheduling]:
+        if not self.schedule or config.getoption("dist") != "load":
+            return None
+        return DurationScheduling(config, self.durations, log)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        if report.skipped:
+            self._skipped.add(report.nodeid)
+        self._seconds[report.nodeid] = (
+            self._seconds.get(report.nodeid, 0.0) + report.duration
+        )
+        if report.when != "teardown":
+            return
+        seconds = self._seconds.pop(report.nodeid)
+        # A skipped test's duration says nothing about how long it takes to run
+        if report.nodeid in self._skipped:
+            self._skipped.discard(report.nodeid)
+            return
+        self.durations.update(report.nodeid, seconds)
+        self._updated = True
+
+    def pytest_sessionfinish(self, session: pytest.Session):
+        if self._updated:
+            self.durations.save()
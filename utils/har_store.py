@@ -0,0 +1,65 @@
+"""
+Versioned on-disk store of per-scenario HAR recordings.
+
+``record`` mode captures every response a scenario receives into its own HAR file
+(written when the scenario's browser context closes). ``replay`` mode serves those
+responses back through Playwright routing and aborts anything that was not recorded,
+so replay runs never touch the network.
+"""
+
+import os
+import re
+
+from playwright.async_api import BrowserContext
+
+RECORD_MODE = "record"
+REPLAY_MODE = "replay"
+
+# Bump when the recording format or the routing around it changes incompatibly
+HAR_STORE_VERSION = "v1"
+
+
+class HarStore:
+    """
+    Args:
+        root_dir: Directory holding ``<version>/<device>/<scenario>.har`` files
+        mode: ``record`` or ``replay``
+    """
+
+    def __init__(self, root_dir: str, mode: str):
+        if mode not in (RECORD_MODE, REPLAY_MODE):
+            raise ValueError(
+                f"Unsupported HAR mode: {mode}. "
+                f"Supported modes: {RECORD_MODE}, {REPLAY_MODE}"
+            )
+        self.root_dir = root_dir
+        self.mode = mode
+
+    def path_for(self, scenario_id: str, device_name: str) -> str:
+        file_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", scenario_id).strip("_")
+        return os.path.join(
+            self.root_dir, HAR_STORE_VERSION, device_name, f"{file_name}.har"
+        )
+
+    async def attach(self, context: BrowserContext, scenario_id: str, device_name: str):
+        """
+        Record into, or replay from, the scenario's HAR file.
+
+        Args:
+            context: Browser context of the scenario, before it navigates anywhere
+            scenario_id: Stable scenario identifier, e.g. the pytest node id
+            device_name: Device the scenario runs on; recordings are kept per device
+        """
+        har_path = self.path_for(scenario_id, device_name)
+        if self.mode == RECORD_MODE:
+            os.makedirs(os.path.dirname(har_path), exist_ok=True)
+            await context.route_from_har(
+                har_path, update=True, update_content="embed", update_mode="full"
+            )
+            return
+        if not os.path.exists(har_path):
+            raise FileNotFoundError(
+                f"No HAR recording for {scenario_id} on {device_name}: {har_path}. "
+                "Run with --record-har first."
+            )
+        await context.route_from_har(har_path, not_found="abort")
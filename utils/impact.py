@@ -0,0 +1,339 @@
+"""
+Impact-based test selection from a git diff.
+
+A recording run (``--record-impact``) stores, for every scenario, the feature lines it
+was defined on, the step functions it ran and the ``BaseActions`` methods it called.
+A selection run (``--impact-since=<ref>``) diffs the tree against ``ref`` and keeps only
+the scenarios touching a changed line:
+
+- a changed function selects the scenarios that ran it;
+- other changes in an indexed Python file (constants, imports, or functions that are
+  not recorded, such as private helpers) select every scenario that used something
+  from that file;
+- a changed scenario in a feature file selects that scenario; changes above the first
+  known scenario (description, Background) select the whole feature;
+- scenarios missing from the index (new ones) are always selected;
+- any other Python or configuration change (conftest, utils, config, pytest.ini, ...)
+  may affect everything, so the whole suite runs.
+"""
+
+import ast
+import fnmatch
+import glob
+import inspect
+import json
+import os
+import re
+import subprocess
+from typing import Callable, Dict, List, Optional, Set
+
+from utils.json_file import write_json_atomic
+from utils.timing import ACTION, TIMED_METHODS, TIMINGS
+
+INDEX_VERSION = 1
+PARTS_SUFFIX = ".parts"
+# Changes to these never affect which scenarios need to run
+IGNORED_PATTERNS = ["*.md", "LICENSE", ".gitignore", ".github/*", "benchmarks/*"]
+HUNK_PATTERN = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def index_key(nodeid: str) -> str:
+    """Node id without parameters, so one index entry covers every device."""
+    return nodeid.split("[", 1)[0]
+
+
+class ImpactIndex:
+    """
+    Scenario -> feature lines and code units (``path::qualname``) it depends on.
+
+    Args:
+        path: JSON file of the merged index
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tests: Dict[str, dict] = {}
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as index_file:
+            data = json.load(index_file)
+        if data.get("version") != INDEX_VERSION:
+            return False
+        self.tests = data["tests"]
+        return True
+
+    def save(self):
+        write_json_atomic(
+            self.path,
+            {"version": INDEX_VERSION, "tests": self.tests},
+            indent=2,
+            sort_keys=True,
+        )
+
+    def part_path(self, worker_id: str) -> str:
+        return os.path.join(f"{self.path}{PARTS_SUFFIX}", f"{worker_id}.json")
+
+    def merge_parts(self):
+        """Fold every process's recorded part into the index and delete the parts."""
+        self.load()
+        parts_dir = f"{self.path}{PARTS_SUFFIX}"
+        for part_path in sorted(glob.glob(os.path.join(parts_dir, "*.json"))):
+            with open(part_path, encoding="utf-8") as part_file:
+                self.tests.update(json.load(part_file))
+            os.remove(part_path)
+        if os.path.isdir(parts_dir):
+            os.rmdir(parts_dir)
+        self.save()
+
+    def affected(
+        self, changes: Dict[str, Set[int]], root_dir: str
+    ) -> Optional[Set[str]]:
+        """
+        Scenarios affected by the changed lines.
+
+        Args:
+            changes: Changed file (relative to ``root_dir``) -> changed line numbers
+            root_dir: Repository root the paths are relative to
+
+        Returns:
+            Affected test keys, or None when the change may affect every scenario
+        """
+        units_by_file: Dict[str, Set[str]] = {}
+        for entry in self.tests.values():
+            for unit in entry["units"]:
+                units_by_file.setdefault(unit.split("::", 1)[0], set()).add(unit)
+        features = {entry["feature"] for entry in self.tests.values()}
+
+        affected: Set[str] = set()
+        for path, lines in changes.items():
+            if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_PATTERNS):
+                continue
+            if path in features:
+                affected |= self._affected_by_feature(path, lines)
+            elif path in units_by_file:
+                affected |= self._affected_by_code(
+                    root_dir, path, lines, units_by_file[path]
+                )
+            elif path.endswith(".feature"):
+                # A feature nothing was recorded from only holds new scenarios
+                continue
+            else:
+                return None
+        return affected
+
+    def _affected_by_code(
+        self, root_dir: str, path: str, lines: Set[int], recorded_units: Set[str]
+    ) -> Set[str]:
+        changed_names = self._changed_units(os.path.join(root_dir, path), lines)
+        changed_units = (
+            None
+            if changed_names is None
+            else {f"{path}::{name}" for name in changed_names}
+        )
+        # Private and module-level helpers are never recorded, yet any recorded unit of
+        # the file may call them
+        if changed_units is None or not changed_units <= recorded_units:
+            changed_units = recorded_units
+        return {
+            key
+            for key, entry in self.tests.items()
+            if changed_units & set(entry["units"])
+        }
+
+    def _affected_by_feature(self, path: str, lines: Set[int]) -> Set[str]:
+        in_feature = sorted(
+            (entry["lines"][0], key)
+            for key, entry in self.tests.items()
+            if entry["feature"] == path
+        )
+        if not in_feature:
+            return set()
+        # A scenario owns its lines up to the next scenario, so appended steps count
+        if any(line < in_feature[0][0] for line in lines):
+            # Feature description or Background: shared by every scenario
+            return {key for _, key in in_feature}
+        affected = set()
+        for position, (start, key) in enumerate(in_feature):
+            next_start = (
+                in_feature[position + 1][0]
+                if position + 1 < len(in_feature)
+                else float("inf")
+            )
+            if any(start <= line < next_start for line in lines):
+                affected.add(key)
+        return affected
+
+    @staticmethod
+    def _changed_units(file_path: str, lines: Set[int]) -> Optional[Set[str]]:
+        """
+        Qualified names of the functions containing the changed lines.
+
+        Returns:
+            The names, or None if a line falls outside every function (or the file is
+            gone), meaning anything in the file may be affected
+        """
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, encoding="utf-8") as source_file:
+            tree = ast.parse(source_file.read())
+        spans = []
+
+        def visit(node: ast.AST, prefix: str):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    start = min(
+                        [child.lineno]
+                        + [decorator.lineno for decorator in child.decorator_list]
+                    )
+                    spans.append((start, child.end_lineno, f"{prefix}{child.name}"))
+                elif isinstance(child, ast.ClassDef):
+                    visit(child, f"{prefix}{child.name}.")
+
+        visit(tree, "")
+        names = set()
+        for line in lines:
+            containing = [name for start, end, name in spans if start <= line <= end]
+            if not containing:
+                return None
+            names.update(containing)
+        return names
+
+
+class ImpactRecorder:
+    """
+    pytest plugin recording what every scenario run in this process depends on.
+
+    Args:
+        index: Index whose per-process part is written at session end
+        root_dir: Repository root that recorded paths are made relative to
+        worker_id: Name of this process's part file
+        merge: Merge all parts into the index at session end (controlling process)
+    """
+
+    def __init__(
+        self, index: ImpactIndex, root_dir: str, worker_id: str, merge: bool = False
+    ):
+        self.index = index
+        self.root_dir = root_dir
+        self.worker_id = worker_id
+        self.merge = merge
+        self.tests: Dict[str, dict] = {}
+        self._current: Optional[dict] = None
+        self._first_sample = 0
+
+    def pytest_runtest_logstart(self, nodeid: str, location):
+        self._current = {"feature": None, "lines": [0, 0], "units": set()}
+        self._first_sample = len(TIMINGS.samples)
+
+    def pytest_bdd_before_scenario(self, request, feature, scenario):
+        if self._current is None:
+            return
+        step_lines = [step.line_number for step in scenario.steps]
+        # The line above the scenario holds its tags
+        self._current["feature"] = self._relative(feature.filename)
+        self._current["lines"] = [
+            scenario.line_number - 1,
+            max(step_lines, default=scenario.line_number),
+        ]
+
+    def pytest_bdd_before_step(self, request, feature, scenario, step, step_func):
+        if self._current is not None:
+            self._current["units"].add(self._unit(step_func))
+
+    def pytest_runtest_logfinish(self, nodeid: str, location):
+        if self._current is None:
+            return
+        first_sample = self._first_sample
+        for sample in TIMINGS.samples[first_sample:]:
+            method = TIMED_METHODS.get(sample["name"])
+            if sample["category"] == ACTION and method is not None:
+                self._current["units"].add(self._unit(method))
+        if self._current["feature"] is not None:
+            self._current["units"] = sorted(self._current["units"])
+            self.tests[index_key(nodeid)] = self._current
+        self._current = None
+
+    def pytest_sessionfinish(self, session):
+        # xdist workers finish before the controlling process does
+        if self.tests:
+            part_path = self.index.part_path(self.worker_id)
+            os.makedirs(os.path.dirname(part_path), exist_ok=True)
+            with open(part_path, "w", encoding="utf-8") as part_file:
+                json.dump(self.tests, part_file)
+        if self.merge:
+            self.index.merge_parts()
+
+    def _unit(self, func: Callable) -> str:
+        func = inspect.unwrap(func)
+        return f"{self._relative(inspect.getsourcefile(func))}::{func.__qualname__}"
+
+    def _relative(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root_dir).replace(
+            os.sep, "/"
+        )
+
+
+def changed_lines(since: str, root_dir: str) -> Dict[str, Set[int]]:
+    """
+    Lines changed between ``since`` and the working tree, per file.
+
+    For deleted lines the surrounding lines of the new version are reported, and a
+    deleted file is reported with no lines.
+
+    Args:
+        since: Git revision to diff against (e.g. ``origin/main``)
+        root_dir: Repository root
+
+    Returns:
+        Path relative to the repository root -> changed line numbers
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", "--no-renames", since, "--"],
+        cwd=root_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    changes: Dict[str, Set[int]] = {}
+    old_path = path = None
+    deleted = False
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            deleted = not line.startswith("+++ b/")
+            path = old_path if deleted else line[6:]
+            changes.setdefault(path, set())
+        elif path is not None and not deleted:
+            match = HUNK_PATTERN.match(line)
+            if match is None:
+                continue
+            start = int(match.group(1))
+            count = int(match.group(2) or 1)
+            if count:
+                changes[path].update(range(start, start + count))
+            else:
+                changes[path].update({start, start + 1})
+    return changes
+
+
+def select(
+    items: List, index: ImpactIndex, changes: Dict[str, Set[int]], root_dir: str
+) -> List:
+    """
+    Items affected by the changes; new items (not in the index) are always kept.
+
+    Returns:
+        The items to run, in their original order
+    """
+    affected = index.affected(changes, root_dir)
+    if affected is None:
+        return list(items)
+    return [
+        item
+        for item in items
+        if index_key(item.nodeid) in affected
+        or index_key(item.nodeid) not in index.tests
+    ]
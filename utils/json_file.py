@@ -0,0 +1,27 @@
+"""
+Atomic JSON file writes shared by the on-disk stores (caches, manifests, indexes).
+
+The data is written to a temporary file next to the target, named after the writing
+process, and renamed over the target, so parallel xdist workers never read a half-written
+file and never clobber each other's temporary file.
+"""
+
+import json
+import os
+from typing import Any
+
+
+def write_json_atomic(path: str, data: Any, **dump_kwargs):
+    """
+    Write ``data`` as JSON to ``path``, creating its directory if needed.
+
+    Args:
+        path: Target file
+        data: JSON-serializable value
+        **dump_kwargs: Passed on to ``json.dump`` (e.g. ``indent``, ``sort_keys``)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, **dump_kwargs)
+    os.replace(temp_path, path)
@@ -0,0 +1,183 @@
+"""
+Locator manifest that promotes resolved ``act()`` actions to static Playwright locators.
+
+``compile`` mode records, for every device and step text, the element each successful
+``act()`` chose as the most stable unique selector available (id, href, aria-label,
+text...). ``fast`` mode replays those locators with plain Playwright calls without touching
+the model; the caller only falls back to ``act()`` when a recorded locator no longer works,
+and the locators that ``act()`` resolves from there on replace the step's stale ones.
+"""
+
+import json
+from typing import Dict, List, Optional, Set
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
+from stagehand.schemas import ActResult, ObserveResult
+
+from utils.json_file import write_json_atomic
+
+OFF_MODE = "off"
+COMPILE_MODE = "compile"
+FAST_MODE = "fast"
+LOCATOR_MODES = [OFF_MODE, COMPILE_MODE, FAST_MODE]
+
+# Short timeout so a stale locator falls back to the model quickly
+REPLAY_TIMEOUT = 5
+
+# Candidate selectors for the element at the given XPath, most stable first
+SELECTOR_CANDIDATES_SCRIPT = """
+(xpath) => {
+    const element = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (!element) {
+        return [];
+    }
+    const tag = element.tagName.toLowerCase();
+    const candidates = [];
+    if (element.id) {
+        candidates.push(`#${CSS.escape(element.id)}`);
+    }
+    for (const name of ["data-testid", "href", "aria-label", "name"]) {
+        const value = element.getAttribute(name);
+        if (value) {
+            candidates.push(`${tag}[${name}=${JSON.stringify(value)}]`);
+        }
+    }
+    const text = (element.innerText || "").trim();
+    if (text && text.length <= 60) {
+        candidates.push(`${tag}:text-is(${JSON.stringify(text)})`);
+    }
+    return candidates;
+}
+"""
+
+
+class LocatorManifest:
+    """
+    Per-device, per-step list of compiled locators, persisted as JSON.
+
+    Args:
+        path: Manifest file; None keeps the manifest in memory only
+        mode: One of ``off``, ``compile`` or ``fast``
+    """
+
+    def __init__(self, path: Optional[str] = None, mode: str = OFF_MODE):
+        if mode not in LOCATOR_MODES:
+            raise ValueError(
+                f"Unsupported locator mode: {mode}. "
+                f"Supported modes: {', '.join(LOCATOR_MODES)}"
+            )
+        self.path = path
+        self.mode = mode
+        self._entries: Dict[str, List[dict]] = self._read() if path else {}
+        self._changed_steps: Set[str] = set()
+        self._current_step: Optional[str] = None
+        self._cursor = 0
+        self._healing = False
+
+    def begin_step(self, step_text: str, device: str):
+        """
+        Start a step; each device gets its own locators, since layouts differ per device.
+        """
+        self._current_step = f"{device}|{step_text}"
+        self._cursor = 0
+        self._healing = False
+        if self.mode == COMPILE_MODE:
+            self._entries[self._current_step] = []
+            self._changed_steps.add(self._current_step)
+
+    async def compile(self, page: Page, action: ObserveResult) -> Optional[dict]:
+        """
+        Build a manifest entry for an action before it runs (it may navigate away).
+
+        Returns:
+            Entry to pass to ``record`` once the action succeeded, or None when neither
+            compiling nor replacing stale fast-mode locators
+        """
+        if self._current_step is None:
+            return None
+        if self.mode != COMPILE_MODE and not self._healing:
+            return None
+        return {
+            "method": action.method,
+            "locator": await self._stable_selector(page, action.selector),
+            "arguments": action.arguments or [],
+        }
+
+    def record(self, entry: Optional[dict]):
+        if entry is not None and self._current_step is not None:
+            self._entries[self._current_step].append(entry)
+
+    async def replay(self, page: Page) -> Optional[ActResult]:
+        """
+        Execute the next compiled locator of the current step.
+
+        A miss drops the step's remaining locators: the caller resolves the rest of the
+        step with ``act()``, and the locators compiled from those actions replace them.
+
+        Returns:
+            ActResult on success, None when there is no entry or the locator failed
+        """
+        if self._current_step is None or self._healing:
+            return None
+        entries = self._entries.setdefault(self._current_step, [])
+        position = self._cursor
+        self._cursor += 1
+        try:
+            if position >= len(entries):
+                raise ValueError("No compiled locator left for this step")
+            entry = entries[position]
+            await self._execute(page, entry)
+        except (PlaywrightError, ValueError):
+            del entries[position:]
+            self._healing = True
+            self._changed_steps.add(self._current_step)
+            return None
+        return ActResult(
+            success=True,
+            message=f"Replayed [{entry['method']}] on {entry['locator']} from manifest",
+            action=self._current_step,
+        )
+
+    def save(self):
+        if not self._changed_steps or not self.path:
+            return
+        # Other xdist workers compile other steps into the same file
+        entries = self._read()
+        entries.update({step: self._entries[step] for step in self._changed_steps})
+        write_json_atomic(
+            self.path, entries, indent=2, ensure_ascii=False, sort_keys=True
+        )
+
+    def _read(self) -> Dict[str, List[dict]]:
+        try:
+            with open(self.path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    async def _stable_selector(page: Page, selector: str) -> str:
+        xpath = selector.replace("xpath=", "", 1)
+        candidates = await page.evaluate(SELECTOR_CANDIDATES_SCRIPT, xpath)
+        for candidate in candidates:
+            if await page.locator(candidate).count() == 1:
+                return candidate
+        return selector
+
+    @staticmethod
+    async def _execute(page: Page, entry: dict):
+        locator = page.locator(entry["locator"])
+        timeout = REPLAY_TIMEOUT * 1000
+        method = entry["method"]
+        if method == "click":
+            await locator.click(timeout=timeout)
+        elif method == "hover":
+            await locator.hover(timeout=timeout)
+        elif method in ("fill", "type") and entry["arguments"]:
+            # fill() replaces whatever the field already holds
+            await locator.fill(entry["arguments"][0], timeout=timeout)
+        else:
+            raise ValueError(f"Unsupported manifest method: {method}")
@@ -0,0 +1,152 @@
+"""
+Queue-based logging for test runs.
+
+Every process (each pytest-xdist worker included) puts its log records on an in-memory
+queue; a listener thread formats them and writes ``<log_dir>/pytest_<worker>.log``,
+rotating by size and optionally gzipping old files. Nothing on the asyncio loop that
+drives the browser waits for disk I/O. Stagehand's own log lines are routed into the
+``stagehand`` logger instead of being printed to the console with Rich.
+"""
+
+import gzip
+import logging
+import os
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+LOG_FORMAT = "%(asctime)s [%(levelname)8s] [%(name)s:%(lineno)d] %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Levels per logger; --logger-levels overrides individual entries
+DEFAULT_LOGGER_LEVELS = {
+    "stagehand": "INFO",
+    "playwright": "WARNING",
+    "asyncio": "WARNING",
+    "httpx": "WARNING",
+    "httpcore": "WARNING",
+    "LiteLLM": "WARNING",
+    "litellm": "WARNING",
+    # pytest-bdd step parsers
+    "parse": "WARNING",
+    "tests": "DEBUG",
+    "utils": "DEBUG",
+}
+
+# Stagehand verbosity (0=error, 1=info, 2=debug) as logging levels
+STAGEHAND_LEVELS = {0: logging.ERROR, 1: logging.INFO, 2: logging.DEBUG}
+STAGEHAND_LOGGER = "stagehand"
+
+
+def parse_logger_levels(value: Optional[str]) -> Dict[str, str]:
+    """
+    Parse ``name=LEVEL`` pairs, e.g. ``stagehand=DEBUG,playwright=INFO``.
+
+    Returns:
+        DEFAULT_LOGGER_LEVELS updated with the given pairs
+    """
+    levels = dict(DEFAULT_LOGGER_LEVELS)
+    for pair in filter(None, (value or "").split(",")):
+        name, _, level = pair.partition("=")
+        level = level.strip().upper()
+        if not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Unknown log level {level!r} for logger {name.strip()!r}")
+        levels[name.strip()] = level
+    return levels
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as source_file, gzip.open(dest, "wb") as dest_file:
+        shutil.copyfileobj(source_file, dest_file)
+    os.remove(source)
+
+
+class LogPipeline:
+    """
+    Root logger -> queue -> listener thread -> rotating per-worker log file.
+
+    Args:
+        log_dir: Directory of the log files
+        worker_id: pytest-xdist worker id, used in the file name
+        logger_levels: Logger name -> level name
+        compress: Gzip rotated log files
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        worker_id: str,
+        logger_levels: Dict[str, str],
+        compress: bool = False,
+    ):
+        self.path = os.path.join(log_dir, f"pytest_{worker_id}.log")
+        self.logger_levels = logger_levels
+        self.compress = compress
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+
+    def start(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        file_handler = RotatingFileHandler(
+            self.path,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+        if self.compress:
+            file_handler.namer = lambda name: f"{name}.gz"
+            file_handler.rotator = _gzip_rotator
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, file_handler)
+        self._listener.start()
+        self._queue_handler = QueueHandler(log_queue)
+        logging.getLogger().addHandler(self._queue_handler)
+
+        for name, level in self.logger_levels.items():
+            logging.getLogger(name).setLevel(level)
+
+    def stop(self):
+        if self._queue_handler is not None:
+            logging.getLogger().removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._listener is not None:
+            # Writes out everything still queued before the thread exits
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+
+    def stagehand_verbosity(self) -> int:
+        """Stagehand ``verbose`` setting matching the ``stagehand`` logger's level."""
+        stagehand_logger = logging.getLogger(STAGEHAND_LOGGER)
+        if stagehand_logger.isEnabledFor(logging.DEBUG):
+            return 2
+        if stagehand_logger.isEnabledFor(logging.INFO):
+            return 1
+        return 0
+
+
+def stagehand_log_handler(log_data: dict):
+    """
+    ``StagehandConfig(logger=...)`` callback that hands Stagehand's log lines to logging.
+
+    Args:
+        log_data: Stagehand log line (message, level, category, auxiliary)
+    """
+    message = log_data["message"]
+    level = STAGEHAND_LEVELS.get(message.get("level", 1), logging.INFO)
+    category = log_data.get("category")
+    name = f"{STAGEHAND_LOGGER}.{category}" if category else STAGEHAND_LOGGER
+    target = logging.getLogger(name)
+    if not target.isEnabledFor(level):
+        return
+    if "auxiliary" in log_data and target.isEnabledFor(logging.DEBUG):
+        target.log(level, "%s %s", message.get("message"), log_data["auxiliary"])
+    else:
+        target.log(level, "%s", message.get("message"))
@@ -0,0 +1,213 @@
+"""
+Local stand-in for the Stagehand model, served over an OpenAI-compatible HTTP endpoint.
+
+``--stagehand-model=mock`` points Stagehand's LiteLLM client at this server. Every chat
+completion (the ``observe`` call behind ``act()``/``observe()``, and ``extract()``) is
+answered from a recording keyed by the system prompt and the instruction. Element ids
+in recorded ``observe`` answers are rebound to the current accessibility tree by the
+text of the element's tree line, since ids change between page loads.
+
+Recordings are made by running once with ``--mock-llm-upstream=<model>``: misses are then
+forwarded to that OpenAI model and stored. Without an upstream, a miss returns no elements.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from utils.json_file import write_json_atomic
+
+MOCK_MODEL = "mock"
+# LiteLLM needs a provider prefix to route the call to an OpenAI-compatible api_base
+MOCK_MODEL_NAME = "openai/stagehand-mock"
+UPSTREAM_BASE_URL = os.getenv("MOCK_LLM_UPSTREAM_BASE_URL", "https://api.openai.com/v1")
+UPSTREAM_TIMEOUT = 120
+EMPTY_RESPONSE = json.dumps({"elements": []})
+
+# "  [123] link: CONTACT US" lines of Stagehand's simplified accessibility tree
+TREE_LINE_PATTERN = re.compile(r"^\s*\[([^\]]+)\] (.+)$", re.MULTILINE)
+
+
+class MockLLMServer:
+    """
+    Args:
+        recordings_dir: Directory holding one JSON recording per prompt key
+        upstream_model: OpenAI model that answers and records misses; None disables recording
+    """
+
+    def __init__(self, recordings_dir: str, upstream_model: Optional[str] = None):
+        self.recordings_dir = recordings_dir
+        self.upstream_model = upstream_model
+        self._server: Optional[ThreadingHTTPServer] = None
+        os.makedirs(recordings_dir, exist_ok=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        mock_llm = self
+
+        class ChatCompletionsHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not self.path.endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                payload = json.dumps(mock_llm.complete(body)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), ChatCompletionsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def stagehand_options(self) -> dict:
+        """
+        Returns:
+            StagehandConfig keyword arguments that route model calls to this server
+        """
+        return {
+            "model_name": MOCK_MODEL_NAME,
+            "model_api_key": MOCK_MODEL,
+            "model_client_options": {"api_base": self.base_url},
+        }
+
+    def complete(self, body: dict) -> dict:
+        key, tree = self._parse_prompt(body.get("messages", []))
+        recording = self._load(key)
+        if recording is not None:
+            content = self._rebind(recording, tree)
+        elif self.upstream_model:
+            content = self._forward(body)
+            self._store(key, content, tree)
+        else:
+            print(f"Mock LLM has no recording for prompt {key[:12]}, answering empty")
+            content = EMPTY_RESPONSE
+        return {
+            "id": f"chatcmpl-mock-{key[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": MOCK_MODEL_NAME,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }
+
+    @staticmethod
+    def _parse_prompt(messages: List[dict]) -> Tuple[str, str]:
+        system_prompt = "".join(
+            str(message.get("content"))
+            for message in messages
+            if message["role"] == "system"
+        )
+        user_prompt = str(messages[-1].get("content", "")) if messages else ""
+        # observe/extract prompts: "instruction: ...\n<tree name>: <tree>"
+        instruction, _, tree = user_prompt.partition("\n")
+        if not instruction.lower().startswith("instruction:"):
+            instruction, tree = user_prompt, ""
+        raw_key = "\n".join([system_prompt, instruction])
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest(), tree
+
+    def _forward(self, body: dict) -> str:
+        upstream_body = {**body, "model": self.upstream_model}
+        if "gpt-5" in self.upstream_model:
+            upstream_body["temperature"] = 1
+        upstream_request = urllib.request.Request(
+            f"{UPSTREAM_BASE_URL}/chat/completions",
+            data=json.dumps(upstream_body).encode("utf-8"),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', '')}",
+            },
+        )
+        with urllib.request.urlopen(
+            upstream_request, timeout=UPSTREAM_TIMEOUT
+        ) as response:
+            return json.load(response)["choices"][0]["message"]["content"]
+
+    def _rebind(self, recording: dict, tree: str) -> str:
+        element_lines = recording.get("element_lines")
+        if not element_lines:
+            return recording["content"]
+        current_ids = self._ids_by_line(tree)
+        elements = []
+        for element, element_line in zip(
+            json.loads(recording["content"])["elements"], element_lines
+        ):
+            candidates = current_ids.get(element_line["line"], [])
+            if element_line["occurrence"] < len(candidates):
+                element_id = candidates[element_line["occurrence"]]
+                element["element_id"] = (
+                    int(element_id) if element_id.isdigit() else element_id
+                )
+                elements.append(element)
+        return json.dumps({"elements": elements})
+
+    @staticmethod
+    def _ids_by_line(tree: str) -> Dict[str, List[str]]:
+        ids_by_line: Dict[str, List[str]] = {}
+        for element_id, line in TREE_LINE_PATTERN.findall(tree):
+            ids_by_line.setdefault(line, []).append(element_id)
+        return ids_by_line
+
+    @staticmethod
+    def _line_positions(tree: str) -> Dict[str, Tuple[str, int]]:
+        # element id -> (tree line text, index among lines with the same text)
+        positions: Dict[str, Tuple[str, int]] = {}
+        line_counts: Dict[str, int] = {}
+        for element_id, line in TREE_LINE_PATTERN.findall(tree):
+            positions[element_id] = (line, line_counts.get(line, 0))
+            line_counts[line] = line_counts.get(line, 0) + 1
+        return positions
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.recordings_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), encoding="utf-8") as recording_file:
+                return json.load(recording_file)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, content: str, tree: str):
+        recording = {"content": content}
+        try:
+            elements = json.loads(content).get("elements")
+        except (ValueError, AttributeError):
+            elements = None
+        if elements is not None:
+            positions = self._line_positions(tree)
+            recording["element_lines"] = []
+            for element in elements:
+                line, occurrence = positions.get(
+                    str(element.get("element_id")), ("", 0)
+                )
+                recording["element_lines"].append(
+                    {"line": line, "occurrence": occurrence}
+                )
+        write_json_atomic(self._path(key), recording, indent=2, ensure_ascii=False)
@@ -0,0 +1,119 @@
+"""
+Route-level request filtering applied to every browser context a scenario gets.
+
+A profile blocks requests by Playwright resource type and by domain deny/allow lists.
+Blocked images are answered with a 1x1 transparent PNG instead of being aborted, so
+``<img>`` elements keep a box and visibility assertions behave as with real images.
+"""
+
+import base64
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Route
+
+PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kg"
+    "AAAABJRU5ErkJggg=="
+)
+
+# Ads, analytics and third-party social widgets; none of them is asserted on
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "platform.twitter.com",
+    "platform.linkedin.com",
+    "snap.licdn.com",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """
+    Args:
+        name: Preset name, as given to --network-profile
+        blocked_resource_types: Playwright resource types never loaded (image, font, media...)
+        blocked_domains: Domains (and their subdomains) never loaded
+        allowed_domains: When set, only these domains (and their subdomains) are loaded
+    """
+
+    name: str
+    blocked_resource_types: FrozenSet[str] = frozenset()
+    blocked_domains: Tuple[str, ...] = ()
+    allowed_domains: Optional[Tuple[str, ...]] = None
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(
+            self.blocked_resource_types
+            or self.blocked_domains
+            or self.allowed_domains is not None
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_resource_types:
+            return True
+        host = urlsplit(url).hostname
+        if host is None:
+            return False
+        if _matches_domain(host, self.blocked_domains):
+            return True
+        return self.allowed_domains is not None and not _matches_domain(
+            host, self.allowed_domains
+        )
+
+    async def attach(self, context: BrowserContext):
+        """
+        Route every request of the context through this profile.
+
+        Args:
+            context: Fresh browser context, before any page is opened
+        """
+        if self.blocks_anything:
+            await context.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route):
+        request = route.request
+        if not self.should_block(request.resource_type, request.url):
+            await route.fallback()
+        elif request.resource_type == "image":
+            await route.fulfill(
+                status=200, content_type="image/png", body=PLACEHOLDER_PNG
+            )
+        else:
+            await route.abort("blockedbyclient")
+
+
+def _matches_domain(host: str, domains: Tuple[str, ...]) -> bool:
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+NETWORK_PROFILES = {
+    "full": NetworkProfile(name="full"),
+    "lean": NetworkProfile(
+        name="lean",
+        blocked_resource_types=frozenset({"media"}),
+        blocked_domains=TRACKER_DOMAINS,
+    ),
+    "assertions-only": NetworkProfile(
+        name="assertions-only",
+        blocked_resource_types=frozenset({"image", "media", "font"}),
+        blocked_domains=TRACKER_DOMAINS,
+    ),
+}
+
+
+def get_network_profile(name: str) -> NetworkProfile:
+    if name not in NETWORK_PROFILES:
+        raise ValueError(
+            f"Unsupported network profile: {name}. "
+            f"Supported profiles: {', '.join(NETWORK_PROFILES)}"
+        )
+    return NETWORK_PROFILES[name]
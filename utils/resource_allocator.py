@@ -0,0 +1,200 @@
+"""
+Deterministic per-worker allocation of browser resources for parallel runs.
+
+Profile directories are derived from the pytest-xdist worker id, so no two workers
+(or pool slots) ever share one. Debug ports are not allocated at all: Chromium binds
+port 0 and the pool reads the chosen endpoint back from its ``DevTools listening`` line.
+
+Every launched browser is also tracked by PID in a per-run directory, so the reaper can
+kill exactly the browsers this run started (in any worker) and leave everything else on
+the machine alone.
+"""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import uuid
+from typing import Dict, Optional
+
+# Ask Chromium to pick a free port itself; the pool reads the endpoint back from stderr
+AUTO_DEBUG_PORT = 0
+
+PROFILE_DIR_PREFIX = "stagehand_test"
+
+# Set by the first (controlling) process and inherited by its xdist workers, so they all
+# share one id; a plain pytest run gets its own
+RUN_ID_ENV = "STAGEHAND_RUN_ID"
+_RUN_ID = os.environ.setdefault(
+    RUN_ID_ENV, os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+)
+
+# PID -> profile directory of the browsers this process launched and has not stopped
+_tracked_browsers: Dict[int, str] = {}
+
+
+def get_worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def allocate_profile_dir(slot: int) -> str:
+    """
+    Create an empty Chromium profile directory owned by this worker and pool slot.
+
+    Args:
+        slot: Index of the browser inside this worker's pool
+
+    Returns:
+        Absolute path of the profile directory
+    """
+    profile_dir = os.path.join(
+        tempfile.gettempdir(),
+        f"{PROFILE_DIR_PREFIX}_{_RUN_ID[:12]}_{get_worker_id()}_{slot}",
+    )
+    # A crashed run with the same id may have left a stale profile behind
+    shutil.rmtree(profile_dir, ignore_errors=True)
+    os.makedirs(profile_dir)
+    return profile_dir
+
+
+def _pid_dir() -> str:
+    return os.path.join(
+        tempfile.gettempdir(), f"{PROFILE_DIR_PREFIX}_{_RUN_ID[:12]}_pids"
+    )
+
+
+def _pid_file(worker_id: str) -> str:
+    return os.path.join(_pid_dir(), f"{worker_id}.json")
+
+
+def _write_tracked_browsers():
+    os.makedirs(_pid_dir(), exist_ok=True)
+    with open(_pid_file(get_worker_id()), "w", encoding="utf-8") as pid_file:
+        json.dump(_tracked_browsers, pid_file)
+
+
+def track_browser(pid: int, profile_dir: str):
+    """
+    Record a browser launched in its own process group, so the reaper can find it.
+
+    Args:
+        pid: PID (and process group id) of the browser process
+        profile_dir: Its --user-data-dir, used to recognise the process later
+    """
+    _tracked_browsers[pid] = profile_dir
+    _write_tracked_browsers()
+
+
+def untrack_browser(pid: int):
+    if _tracked_browsers.pop(pid, None) is not None:
+        _write_tracked_browsers()
+
+
+def kill_process_group(pid: int):
+    """Kill whatever is left of a tracked browser's process group (renderers, GPU...)."""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def process_group_rss(pgid: int) -> int:
+    """
+    Resident memory of a browser and its child processes (renderers, GPU...).
+
+    Shared pages are counted once per process, so this overestimates what the group
+    would free on exit, which is the safe side for a memory ceiling.
+
+    Args:
+        pgid: Process group id, i.e. the PID of a browser launched in its own session
+
+    Returns:
+        Summed RSS in bytes (0 once the group has exited)
+    """
+    if not os.path.isdir("/proc"):
+        # No procfs (macOS)
+        completed = subprocess.run(
+            ["ps", "-A", "-o", "pgid=,rss="], capture_output=True, text=True
+        )
+        return sum(
+            int(rss) * 1024
+            for group, rss in (line.split() for line in completed.stdout.splitlines())
+            if int(group) == pgid
+        )
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields after it are fixed (see proc(5))
+        fields = stat.rsplit(")", 1)[1].split()
+        if int(fields[2]) == pgid:
+            total += int(fields[21]) * page_size
+    return total
+
+
+def _command_line(pid: int) -> Optional[str]:
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as cmdline_file:
+            return cmdline_file.read().replace(b"\0", b" ").decode(errors="replace")
+    except FileNotFoundError:
+        if os.path.isdir("/proc"):
+            return None
+    except OSError:
+        return None
+    # No procfs (macOS)
+    completed = subprocess.run(
+        ["ps", "-o", "command=", "-p", str(pid)], capture_output=True, text=True
+    )
+    return completed.stdout.strip() or None
+
+
+def reap_browsers(all_workers: bool = False) -> int:
+    """
+    Kill browsers of this run that are still alive and delete their profiles.
+
+    A PID only counts while its command line still names the recorded profile
+    directory, so a PID reused by an unrelated process is never killed.
+
+    Args:
+        all_workers: Also reap browsers tracked by other workers of this run (for the
+            controlling process, after every worker has finished or crashed)
+
+    Returns:
+        Number of browser processes killed
+    """
+    if all_workers:
+        pid_files = [
+            os.path.join(_pid_dir(), name)
+            for name in (os.listdir(_pid_dir()) if os.path.isdir(_pid_dir()) else [])
+        ]
+    else:
+        pid_files = [_pid_file(get_worker_id())]
+
+    reaped = 0
+    for pid_file in pid_files:
+        try:
+            with open(pid_file, encoding="utf-8") as tracked_file:
+                tracked = json.load(tracked_file)
+        except (OSError, ValueError):
+            continue
+        for pid, profile_dir in tracked.items():
+            command_line = _command_line(int(pid))
+            if command_line is not None and profile_dir in command_line:
+                kill_process_group(int(pid))
+                reaped += 1
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        os.remove(pid_file)
+    _tracked_browsers.clear()
+
+    if all_workers:
+        shutil.rmtree(_pid_dir(), ignore_errors=True)
+    return reaped
@@ -0,0 +1,191 @@
+"""
+Wall-time instrumentation for steps, fixtures, ``BaseActions`` calls and model calls.
+
+Every process (each pytest-xdist worker included) records into the module-level
+``TIMINGS`` recorder and dumps its raw samples at session end. The controlling process
+then merges all dumps into a JSON and CSV report and prints the slowest steps plus the
+share of time spent in browser startup, model calls and waits.
+"""
+
+import csv
+import functools
+import glob
+import inspect
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, FrozenSet, Iterator, List
+
+STEP = "step"
+FIXTURE = "fixture"
+TEARDOWN = "teardown"
+ACTION = "action"
+ACT = "act"
+MODEL = "model"
+BROWSER_STARTUP = "browser_startup"
+TEST = "test"
+
+# Categories reported as a share of total test time in the terminal summary
+SUMMARY_CATEGORIES = [BROWSER_STARTUP, MODEL, ACTION]
+SLOWEST_STEPS_SHOWN = 10
+RAW_DIR_NAME = "raw"
+
+# Timed report name ("BaseActions.click_element") -> the undecorated method
+TIMED_METHODS: Dict[str, Callable] = {}
+
+# Categories already being measured further up the current call stack
+_active_categories: ContextVar[FrozenSet[str]] = ContextVar(
+    "active_timing_categories", default=frozenset()
+)
+
+
+class TimingRecorder:
+    """Collects (category, name, seconds) samples for the current process."""
+
+    def __init__(self):
+        self.samples: List[dict] = []
+
+    def record(self, category: str, name: str, seconds: float, nested: bool = False):
+        self.samples.append(
+            {"category": category, "name": name, "seconds": seconds, "nested": nested}
+        )
+
+    @contextmanager
+    def measure(self, category: str, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block. Calls made inside another measurement of the same
+        category are marked nested, so category totals count them only once.
+        """
+        active = _active_categories.get()
+        token = _active_categories.set(active | {category})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start, category in active)
+            _active_categories.reset(token)
+
+    def dump(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as dump_file:
+            json.dump(self.samples, dump_file)
+
+
+TIMINGS = TimingRecorder()
+
+
+def timed_methods(category: str):
+    """
+    Class decorator timing every public coroutine method under the given category.
+
+    Args:
+        category: Report category, e.g. ``action`` for ``BaseActions``
+    """
+
+    def decorate(cls):
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            timed_name = f"{cls.__name__}.{name}"
+            TIMED_METHODS[timed_name] = method
+            setattr(cls, name, _timed(method, category, timed_name))
+        return cls
+
+    return decorate
+
+
+def _timed(method, category: str, name: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        with TIMINGS.measure(category, name):
+            return await method(*args, **kwargs)
+
+    return wrapper
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def raw_dump_path(report_dir: str, worker_id: str) -> str:
+    return os.path.join(report_dir, RAW_DIR_NAME, f"{worker_id}.json")
+
+
+def build_report(report_dir: str) -> dict:
+    """
+    Merge every worker's raw dump and write ``timing_report.json``/``.csv``.
+
+    Args:
+        report_dir: Directory given to --timing-report
+
+    Returns:
+        The merged report: per-name statistics and per-category totals
+    """
+    samples: List[dict] = []
+    for dump_path in sorted(glob.glob(raw_dump_path(report_dir, "*"))):
+        with open(dump_path, encoding="utf-8") as dump_file:
+            samples.extend(json.load(dump_file))
+
+    grouped: Dict[tuple, List[float]] = {}
+    category_totals: Dict[str, float] = {}
+    for sample in samples:
+        grouped.setdefault((sample["category"], sample["name"]), []).append(
+            sample["seconds"]
+        )
+        if not sample["nested"]:
+            category_totals[sample["category"]] = (
+                category_totals.get(sample["category"], 0.0) + sample["seconds"]
+            )
+
+    entries = [
+        {
+            "category": category,
+            "name": name,
+            "count": len(durations),
+            "total": sum(durations),
+            "p50": percentile(durations, 0.5),
+            "p95": percentile(durations, 0.95),
+            "max": max(durations),
+        }
+        for (category, name), durations in grouped.items()
+    ]
+    entries.sort(key=lambda entry: entry["total"], reverse=True)
+    report = {"entries": entries, "category_totals": category_totals}
+
+    with open(
+        os.path.join(report_dir, "timing_report.json"), "w", encoding="utf-8"
+    ) as report_file:
+        json.dump(report, report_file, indent=2, ensure_ascii=False)
+    with open(
+        os.path.join(report_dir, "timing_report.csv"), "w", encoding="utf-8", newline=""
+    ) as report_file:
+        writer = csv.DictWriter(
+            report_file, fieldnames=list(entries[0]) if entries else []
+        )
+        writer.writeheader()
+        writer.writerows(entries)
+    return report
+
+
+def format_summary(report: dict) -> List[str]:
+    lines = [f"Slowest steps (top {SLOWEST_STEPS_SHOWN} by total time):"]
+    steps = [entry for entry in report["entries"] if entry["category"] == STEP]
+    for entry in steps[:SLOWEST_STEPS_SHOWN]:
+        lines.append(
+            f"  {entry['total']:8.2f}s  n={entry['count']:<3} "
+            f"p50={entry['p50']:.2f}s p95={entry['p95']:.2f}s  {entry['name']}"
+        )
+    test_total = report["category_totals"].get(TEST, 0.0)
+    if test_total:
+        lines.append(f"Share of {test_total:.2f}s total test time:")
+        for category in SUMMARY_CATEGORIES:
+            category_total = report["category_totals"].get(category, 0.0)
+            lines.append(
+                f"  {category:<16} {category_total:8.2f}s "
+                f"({category_total / test_total:6.1%})"
+            )
+    return lines